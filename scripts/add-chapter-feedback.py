@@ -3,11 +3,18 @@
 Add end-of-chapter feedback forms to chapters 1-7.
 """
 from pathlib import Path
+import os
 import re
 
 SITE_DIR = Path(__file__).parent.parent / "site"
 READ_DIR = SITE_DIR / "read"
 
+# "End of Chapter X" marker followed by the closing rule; feedback goes after it
+END_PATTERN = re.compile(r'<p><em>End of Chapter \d+</em></p>\s*<hr>')
+
+# Chapter pages are named chapter-NN-<slug>.html
+CHAPTER_FILE_PATTERN = re.compile(r'chapter-(\d{2})-.*\.html$')
+
 # Feedback prompts for each chapter
 FEEDBACK_PROMPTS = {
     1: {
@@ -94,30 +101,26 @@ def generate_feedback_html(chapter_num: int) -> str:
             </div>
 '''
 
+# Feedback blocks are fixed per chapter, so render them once at import
+_FEEDBACK_HTML = {n: generate_feedback_html(n) for n in FEEDBACK_PROMPTS}
+
 def update_chapter_file(filepath: Path, chapter_num: int) -> bool:
     """Add feedback form to a chapter file if needed."""
-    content = filepath.read_text()
-
-    # Skip if already has feedback
-    if 'chapter-feedback' in content:
-        return False
-
     # Only add to chapters 1-7
-    if chapter_num not in FEEDBACK_PROMPTS:
+    feedback_html = _FEEDBACK_HTML.get(chapter_num)
+    if feedback_html is None:
         return False
 
-    feedback_html = generate_feedback_html(chapter_num)
+    # Skip if already has feedback (checked on raw bytes, before decoding)
+    raw = filepath.read_bytes()
+    if b'chapter-feedback' in raw:
+        return False
+    content = raw.decode('utf-8')
 
     # Find the "End of Chapter X" marker and insert feedback before navigation
-    # Pattern: <p><em>End of Chapter X</em></p>
-    end_pattern = r'(<p><em>End of Chapter \d+</em></p>\s*<hr>)'
-
-    if re.search(end_pattern, content):
-        content = re.sub(
-            end_pattern,
-            r'\1' + feedback_html,
-            content
-        )
+    match = END_PATTERN.search(content)
+    if match:
+        content = content[:match.end()] + feedback_html + content[match.end():]
     else:
         # Fallback: insert before navigation div
         content = content.replace(
@@ -128,19 +131,32 @@ def update_chapter_file(filepath: Path, chapter_num: int) -> bool:
     filepath.write_text(content)
     return True
 
+def find_chapter_files(read_dir: Path) -> dict[int, Path]:
+    """Map chapter numbers to their HTML files with a single directory scan."""
+    files_by_chapter = {}
+    try:
+        with os.scandir(read_dir) as entries:
+            for entry in entries:
+                match = CHAPTER_FILE_PATTERN.match(entry.name)
+                if match:
+                    files_by_chapter.setdefault(int(match.group(1)), Path(entry.path))
+    except FileNotFoundError:
+        pass
+    return files_by_chapter
+
 def main():
     """Add feedback forms to chapter files."""
     print("Adding feedback forms to chapters 1-7...")
 
+    files_by_chapter = find_chapter_files(READ_DIR)
+
     for chapter_num in range(1, 13):
-        ch_str = str(chapter_num).zfill(2)
         # Find the chapter file
-        chapter_files = list(READ_DIR.glob(f"chapter-{ch_str}-*.html"))
-        if not chapter_files:
+        filepath = files_by_chapter.get(chapter_num)
+        if filepath is None:
             print(f"  Chapter {chapter_num}: file not found")
             continue
 
-        filepath = chapter_files[0]
         if update_chapter_file(filepath, chapter_num):
             print(f"  Chapter {chapter_num}: added feedback form")
         else:
@@ -13,57 +13,89 @@ Usage:
 """
 
 import argparse
+import bisect
+import heapq
 import json
+import os
 import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
+from operator import itemgetter
 from pathlib import Path
 
+# A word is a run of word characters and apostrophes (kept for contractions);
+# everything else, punctuation included, separates words.
+_WORD_RE = re.compile(r"[\w']+")
+
 
 def normalize_text(text: str) -> str:
     """Normalize text for matching."""
-    # Lowercase
-    text = text.lower()
-    # Remove punctuation except apostrophes
-    text = re.sub(r"[^\w\s']", ' ', text)
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text
+    return ' '.join(get_words(text))
 
 
 def get_words(text: str) -> list:
-    """Extract words from text."""
-    normalized = normalize_text(text)
-    return normalized.split()
+    """Extract lowercase words from text, dropping punctuation."""
+    return _WORD_RE.findall(text.lower())
 
 
-def find_best_match(needle_words: list, haystack_words: list, start_idx: int = 0) -> tuple:
+def find_best_match(needle_words: list, haystack_words: list, start_idx: int = 0,
+                    top_k: int = 5) -> tuple:
     """
     Find the best match for a sequence of words in a larger sequence.
 
+    Windows are ranked by token overlap with the needle, maintained
+    incrementally as the window slides. Only the top_k candidates are
+    verified with SequenceMatcher.
+
     Returns:
         (match_start_idx, match_end_idx, similarity_score)
     """
     if not needle_words:
         return (start_idx, start_idx, 0.0)
 
-    needle_str = ' '.join(needle_words)
-    best_score = 0.0
-    best_start = start_idx
-    best_end = start_idx
-
     # Sliding window search
     window_size = len(needle_words)
     search_start = max(0, start_idx - 50)  # Allow some backward search
     search_end = min(len(haystack_words), start_idx + len(needle_words) * 3)
 
+    if search_end - window_size < search_start:
+        return (start_idx, start_idx, 0.0)
+
+    needle_counts = Counter(needle_words)
+    window_counts = Counter(haystack_words[search_start:search_start + window_size])
+    overlap = sum((needle_counts & window_counts).values())
+    first_word = needle_words[0]
+    scored = []
+
     for i in range(search_start, search_end - window_size + 1):
-        window = haystack_words[i:i + window_size]
-        window_str = ' '.join(window)
+        if i > search_start:
+            # Slide by one: drop the word leaving on the left, add the one entering on the right
+            out_word = haystack_words[i - 1]
+            window_counts[out_word] -= 1
+            if window_counts[out_word] < needle_counts[out_word]:
+                overlap -= 1
+            in_word = haystack_words[i + window_size - 1]
+            if window_counts[in_word] < needle_counts[in_word]:
+                overlap += 1
+            window_counts[in_word] += 1
 
         # Quick check: if first words don't match, skip
-        if window[0] != needle_words[0] and i > search_start + 20:
+        if haystack_words[i] != first_word and i > search_start + 20:
             continue
 
+        scored.append((overlap, i))
+
+    # Verify the strongest candidates in haystack order so ties keep the earliest window
+    candidates = sorted(i for _, i in heapq.nlargest(top_k, scored, key=itemgetter(0)))
+
+    needle_str = ' '.join(needle_words)
+    best_score = 0.0
+    best_start = start_idx
+    best_end = start_idx
+
+    for i in candidates:
+        window_str = ' '.join(haystack_words[i:i + window_size])
         score = SequenceMatcher(None, needle_str, window_str).ratio()
 
         if score > best_score:
@@ -74,6 +106,22 @@ def find_best_match(needle_words: list, haystack_words: list, start_idx: int = 0
     return (best_start, best_end, best_score)
 
 
+def load_transcript(transcript_file: Path) -> tuple:
+    """
+    Load the fields alignment needs from a transcript JSON.
+
+    Only the normalized words and their timestamps are kept; the full word
+    dicts are dropped when this returns.
+
+    Returns:
+        (duration, pauses, words, word_times)
+    """
+    data = json.loads(transcript_file.read_bytes())
+    words = tuple(w['word'].lower().strip() for w in data['words'])
+    word_times = tuple((w['start'], w['end']) for w in data['words'])
+    return data['duration'], data['pauses'], words, word_times
+
+
 def align_chapter(sections_file: Path, transcript_file: Path) -> dict:
     """
     Align manuscript sections with transcript timestamps.
@@ -82,30 +130,29 @@ def align_chapter(sections_file: Path, transcript_file: Path) -> dict:
         Timing metadata with section boundaries and pause analysis
     """
     # Load data
-    with open(sections_file) as f:
-        sections_data = json.load(f)
+    sections_data = json.loads(sections_file.read_bytes())
 
-    with open(transcript_file) as f:
-        transcript_data = json.load(f)
+    # Word list from transcript (tuples: indexed and sliced, never mutated)
+    duration, pauses, t_words, t_word_times = load_transcript(transcript_file)
 
     sections = sections_data['sections']
-    transcript_words = transcript_data['words']
-    pauses = transcript_data['pauses']
-
-    # Build word list from transcript
-    t_words = [w['word'].lower().strip() for w in transcript_words]
-    t_word_times = [(w['start'], w['end']) for w in transcript_words]
+    pauses = sorted(pauses, key=itemgetter('start'))
+    pause_starts = [p['start'] for p in pauses]
+    # An empty or zero-length transcript gives no speaking rate to estimate from
+    words_per_second = len(t_words) / duration if duration > 0 else 0.0
 
     # Align each section
     aligned_sections = []
     current_t_idx = 0
     issues = []
 
-    for section in sections:
-        # Get first ~30 words of section for matching
-        preview_text = section['text_preview'].replace('...', '')
-        section_words = get_words(preview_text)[:30]
+    # First ~30 words of each section, used for matching
+    section_previews = [
+        get_words(section['text_preview'].replace('...', ''))[:30]
+        for section in sections
+    ]
 
+    for section, section_words in zip(sections, section_previews):
         # Find match in transcript
         match_start, match_end, score = find_best_match(
             section_words, t_words, current_t_idx
@@ -123,8 +170,9 @@ def align_chapter(sections_file: Path, transcript_file: Path) -> dict:
         section_start_time = t_word_times[match_start][0] if match_start < len(t_word_times) else 0
 
         # Estimate section end by word count ratio
-        words_per_second = len(t_words) / transcript_data['duration']
-        section_duration_estimate = section['word_count'] / words_per_second
+        section_duration_estimate = (
+            section['word_count'] / words_per_second if words_per_second else 0.0
+        )
         section_end_time_estimate = section_start_time + section_duration_estimate
 
         # Find actual end by looking for pause near expected end
@@ -133,11 +181,10 @@ def align_chapter(sections_file: Path, transcript_file: Path) -> dict:
         pause_adequate = False
 
         if section['expected_pause_after']:
-            # Look for pause near expected section end
-            for pause in pauses:
-                if section_end_time_estimate - 30 < pause['start'] < section_end_time_estimate + 30:
-                    if pause_found is None or pause['duration'] > pause_found['duration']:
-                        pause_found = pause
+            # Look for the longest pause starting within 30s of the expected section end
+            lo = bisect.bisect_right(pause_starts, section_end_time_estimate - 30)
+            hi = bisect.bisect_left(pause_starts, section_end_time_estimate + 30)
+            pause_found = max(pauses[lo:hi], key=itemgetter('duration'), default=None)
 
             if pause_found:
                 actual_end_time = pause_found['end']
@@ -187,7 +234,7 @@ def align_chapter(sections_file: Path, transcript_file: Path) -> dict:
         'file': sections_data['file'].replace('.md', ''),
         'chapter': sections_data['chapter'],
         'title': sections_data['title'],
-        'total_duration': round(transcript_data['duration'], 1),
+        'total_duration': round(duration, 1),
         'word_count': sections_data['total_words'],
         'section_count': len(aligned_sections),
         'section_break_summary': {
@@ -203,6 +250,43 @@ def align_chapter(sections_file: Path, transcript_file: Path) -> dict:
     return result
 
 
+def align_one(sections_file: Path, transcript_file: Path, output_file: Path) -> tuple:
+    """Align one chapter and save its timing file. Returns (result, output_file)."""
+    result = align_chapter(sections_file, transcript_file)
+
+    with open(output_file, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    return result, output_file
+
+
+def list_dir_names(directory: Path) -> set:
+    """Names of all entries in directory from a single scan (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def find_section_files(timing_dir: Path, names: set, chapter: str | None = None) -> list:
+    """
+    Pick the *-sections.json files out of a timing directory listing.
+
+    If chapter is given, only files whose stem contains it are returned
+    (equivalent to globbing '*{chapter}*-sections.json'). Dotfiles are
+    skipped, as glob skips them.
+    """
+    suffix = '-sections.json'
+    return sorted(
+        timing_dir / name
+        for name in names
+        if name.endswith(suffix)
+        and not name.startswith('.')
+        and (chapter is None or chapter in name[:-len(suffix)])
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(description='Align transcript with manuscript sections')
     parser.add_argument('--chapter', type=str, help='Chapter number (01-12) or vignette-a/vignette-b')
@@ -216,10 +300,11 @@ def main():
         return
 
     # Find files to process
-    if args.all:
-        section_files = sorted(args.timing_dir.glob('*-sections.json'))
-    else:
-        section_files = list(args.timing_dir.glob(f'*{args.chapter}*-sections.json'))
+    # One directory listing serves both section discovery and transcript lookups
+    known_files = list_dir_names(args.timing_dir)
+    section_files = find_section_files(
+        args.timing_dir, known_files, None if args.all else args.chapter
+    )
 
     if not section_files:
         print(f"No section files found in {args.timing_dir}")
@@ -231,22 +316,31 @@ def main():
     total_expected = 0
     total_adequate = 0
 
+    # Pair each chapter with its transcript and output path
+    jobs = []
     for sections_file in section_files:
         # Find matching transcript
         stem = sections_file.stem.replace('-sections', '')
-        transcript_file = args.timing_dir / f"{stem}-transcript.json"
+        transcript_name = f"{stem}-transcript.json"
 
-        if not transcript_file.exists():
+        if transcript_name not in known_files:
             print(f"Skipping {sections_file.name}: no transcript found")
             continue
 
-        result = align_chapter(sections_file, transcript_file)
+        jobs.append((
+            sections_file,
+            args.timing_dir / transcript_name,
+            args.timing_dir / f"{stem}-timing.json",
+        ))
 
-        # Save timing file
-        output_file = args.timing_dir / f"{stem}-timing.json"
-        with open(output_file, 'w') as f:
-            json.dump(result, f, indent=2)
+    # Chapters are independent; align them in parallel when there is more than one
+    if len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(align_one, *zip(*jobs)))
+    else:
+        results = [align_one(*job) for job in jobs]
 
+    for result, output_file in results:
         summary = result['section_break_summary']
         print(f"{result['chapter']}: {result['title']}")
         print(f"  Duration: {result['total_duration']}s, Sections: {result['section_count']}")
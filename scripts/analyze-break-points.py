@@ -5,125 +5,194 @@ Analyze audio at section break points to find clean cut locations.
 Uses zero-crossing detection to find optimal silence insertion points.
 Extracts samples around each break for review.
 
+Requires numpy for sample analysis (the `analysis` extra).
+
 Usage:
     python scripts/analyze-break-points.py --chapter 01
 """
 
 import argparse
+import heapq
 import json
 import subprocess
-import struct
-import wave
+from operator import itemgetter
+import sys
 from pathlib import Path
 
-
-def get_samples(audio_path: Path, start_sec: float, duration_sec: float) -> tuple:
-    """Extract raw audio samples from a region."""
-    # Convert MP3 to WAV samples using ffmpeg
-    cmd = [
-        'ffmpeg', '-y',
-        '-ss', str(start_sec),
-        '-t', str(duration_sec),
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    print("Error: numpy package not installed")
+    print("Run: uv pip install -e '.[analysis]'")
+    sys.exit(1)
+
+
+def get_samples(audio_path: Path, start_sec: float | None = None,
+                duration_sec: float | None = None) -> tuple:
+    """Extract raw audio samples from a region (the whole file if no region is given)."""
+    # Decode MP3 straight to raw signed 16-bit PCM; rate and layout are fixed here
+    sample_rate = 44100
+    cmd = ['ffmpeg', '-y', '-nostdin', '-loglevel', 'error']
+    if start_sec is not None:
+        cmd += ['-ss', str(start_sec)]
+    if duration_sec is not None:
+        cmd += ['-t', str(duration_sec)]
+    cmd += [
         '-i', str(audio_path),
-        '-ar', '44100',
+        '-ar', str(sample_rate),
         '-ac', '1',  # mono for analysis
-        '-f', 'wav',
+        '-f', 's16le',
+        '-acodec', 'pcm_s16le',
         '-'
     ]
 
-    result = subprocess.run(cmd, capture_output=True)
+    # stderr is never inspected; don't buffer it
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False)
     if result.returncode != 0:
-        return None, 44100
-
-    # Parse WAV from stdout
-    import io
-    wav_data = io.BytesIO(result.stdout)
-
-    try:
-        with wave.open(wav_data, 'rb') as wf:
-            n_frames = wf.getnframes()
-            sample_rate = wf.getframerate()
-            raw = wf.readframes(n_frames)
-            # Convert to signed 16-bit samples
-            samples = struct.unpack(f'<{n_frames}h', raw)
-            return list(samples), sample_rate
-    except:
-        return None, 44100
-
-
-def find_zero_crossings(samples: list, sample_rate: int, window_ms: int = 100) -> list:
-    """Find zero-crossing points in audio samples."""
-    crossings = []
-    window_samples = int(sample_rate * window_ms / 1000)
+        return None, sample_rate
 
-    for i in range(1, len(samples)):
-        # Zero crossing: sign change
-        if (samples[i-1] >= 0 and samples[i] < 0) or (samples[i-1] < 0 and samples[i] >= 0):
-            # Calculate local energy (RMS) around this point
-            start = max(0, i - window_samples // 2)
-            end = min(len(samples), i + window_samples // 2)
-            window = samples[start:end]
-            rms = (sum(s*s for s in window) / len(window)) ** 0.5
-
-            crossings.append({
-                'sample': i,
-                'time_offset': i / sample_rate,
-                'rms': rms,
-            })
+    return np.frombuffer(result.stdout, dtype='<i2'), sample_rate
+
+
+def find_quiet_block(samples: np.ndarray, sample_rate: int, target_sample: int,
+                     search_ms: int = 200, block_size: int = 1024) -> tuple | None:
+    """
+    Find the quietest block near a target that contains a zero crossing.
+
+    Uses a coarse peak envelope (one value per block_size samples) so the
+    fine-grained crossing search only has to look inside a single block.
+
+    Returns:
+        (start_sample, end_sample) of the block, or None if none qualifies
+    """
+    n_blocks = len(samples) // block_size
+    if n_blocks == 0:
+        return None
 
-    return crossings
+    envelope = np.abs(
+        samples[:n_blocks * block_size].astype(np.int32)
+    ).reshape(-1, block_size).max(axis=1)
+
+    radius = int(sample_rate * search_ms / 1000) // block_size
+    center = target_sample // block_size
+    first = max(0, center - radius)
+    last = min(n_blocks, center + radius + 1)
+    if first >= last:
+        return None
+
+    # Quietest first; an all-zero block has no sign change, so try the next one
+    for block in (first + np.argsort(envelope[first:last], kind='stable')).tolist():
+        lo, hi = block * block_size, (block + 1) * block_size
+        if np.any(np.diff(samples[lo:hi] >= 0)):
+            return lo, hi
+
+    return None
+
+
+def find_zero_crossings(samples: np.ndarray, sample_rate: int, window_ms: int = 100,
+                        target_sample: int | None = None, search_ms: int = 200) -> list:
+    """
+    Find zero-crossing points in audio samples.
+
+    If target_sample is given, only crossings inside the quietest block
+    within search_ms of the target are returned (see find_quiet_block).
+    """
+    window_samples = int(sample_rate * window_ms / 1000)
+    half = window_samples // 2
+    n = len(samples)
+
+    lo, hi = 0, n
+    if target_sample is not None:
+        block = find_quiet_block(samples, sample_rate, target_sample, search_ms)
+        if block is None:
+            return []
+        lo, hi = block
+
+    # Zero crossing: sign change between consecutive samples
+    signs = samples[lo:hi] >= 0
+    cross_idx = np.nonzero(np.diff(signs))[0] + 1 + lo
+    if len(cross_idx) == 0 or half == 0:
+        return []
+
+    # Local energy (RMS) around each crossing from a prefix sum of squares over
+    # the span the windows touch: sum(x[start:end] ** 2) == cumsq[end] - cumsq[start]
+    span_lo = max(0, lo - half)
+    span_hi = min(n, hi + half)
+    cumsq = np.concatenate(([0], np.cumsum(samples[span_lo:span_hi].astype(np.int64) ** 2)))
+    starts = np.maximum(0, cross_idx - half)
+    ends = np.minimum(n, cross_idx + half)
+    rms = np.sqrt((cumsq[ends - span_lo] - cumsq[starts - span_lo]) / (ends - starts))
+
+    return [
+        {
+            'sample': int(i),
+            'time_offset': int(i) / sample_rate,
+            'rms': float(r),
+        }
+        for i, r in zip(cross_idx, rms)
+    ]
 
 
-def find_silence_regions(samples: list, sample_rate: int,
+def find_silence_regions(samples: np.ndarray, sample_rate: int,
                          threshold: int = 500, min_duration_ms: int = 50) -> list:
     """Find regions of near-silence in audio."""
     min_samples = int(sample_rate * min_duration_ms / 1000)
 
-    regions = []
-    in_silence = False
-    silence_start = 0
-
     # Use a sliding window for smoothing
     window_size = int(sample_rate * 0.01)  # 10ms window
+    hop = window_size // 2
 
-    for i in range(0, len(samples) - window_size, window_size // 2):
-        window = samples[i:i + window_size]
-        peak = max(abs(s) for s in window)
-
-        if peak < threshold:
-            if not in_silence:
-                silence_start = i
-                in_silence = True
-        else:
-            if in_silence:
-                silence_end = i
-                duration = silence_end - silence_start
-                if duration >= min_samples:
-                    regions.append({
-                        'start_sample': silence_start,
-                        'end_sample': silence_end,
-                        'start_time': silence_start / sample_rate,
-                        'end_time': silence_end / sample_rate,
-                        'duration': duration / sample_rate,
-                    })
-                in_silence = False
+    if len(samples) <= window_size:
+        return []
+
+    # Peak amplitude of each half-overlapping 10ms window (int32 so abs(-32768) fits)
+    magnitude = np.abs(samples.astype(np.int32))
+    peaks = sliding_window_view(magnitude, window_size)[:len(samples) - window_size:hop].max(axis=1)
+    silent = peaks < threshold
+
+    # Run boundaries: +1 where silence starts, -1 where it ends. A trailing
+    # run that never ends is not a closed region and is dropped by zip().
+    edges = np.diff(silent.astype(np.int8), prepend=0)
+    starts = np.nonzero(edges == 1)[0] * hop
+    ends = np.nonzero(edges == -1)[0] * hop
+
+    regions = []
+    for silence_start, silence_end in zip(starts.tolist(), ends.tolist()):
+        duration = silence_end - silence_start
+        if duration >= min_samples:
+            regions.append({
+                'start_sample': silence_start,
+                'end_sample': silence_end,
+                'start_time': silence_start / sample_rate,
+                'end_time': silence_end / sample_rate,
+                'duration': duration / sample_rate,
+            })
 
     return regions
 
 
-def extract_sample_clip(audio_path: Path, output_path: Path,
-                        start_sec: float, duration_sec: float):
-    """Extract a clip from the audio file."""
-    cmd = [
-        'ffmpeg', '-y',
-        '-ss', str(start_sec),
-        '-t', str(duration_sec),
-        '-i', str(audio_path),
-        '-c:a', 'libmp3lame',
-        '-b:a', '192k',
-        str(output_path)
-    ]
-    subprocess.run(cmd, capture_output=True)
+def extract_sample_clips(audio_path: Path, clips: list):
+    """
+    Extract several clips from the audio file in one ffmpeg run.
+
+    Args:
+        clips: List of (output_path, start_sec, duration_sec) tuples
+    """
+    if not clips:
+        return
+
+    # One decode of the input, one output per clip (-ss/-t act as output options)
+    cmd = ['ffmpeg', '-y', '-nostdin', '-loglevel', 'error', '-i', str(audio_path)]
+    for output_path, start_sec, duration_sec in clips:
+        cmd += [
+            '-ss', str(start_sec),
+            '-t', str(duration_sec),
+            '-c:a', 'libmp3lame',
+            '-b:a', '192k',
+            str(output_path)
+        ]
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
 
 
 def analyze_chapter(chapter_num: str):
@@ -145,21 +214,24 @@ def analyze_chapter(chapter_num: str):
         print(f"No transcript found for chapter {chapter_num}")
         return
 
-    with open(transcript_files[0]) as f:
-        transcript = json.load(f)
+    transcript = json.loads(transcript_files[0].read_bytes())
 
     pauses = transcript['pauses']
 
     # Find the longest pauses (likely section breaks)
-    top_pauses = sorted(pauses, key=lambda p: p['duration'], reverse=True)[:10]
+    top_pauses = heapq.nlargest(5, pauses, key=itemgetter('duration'))
 
     print(f"=== Chapter {chapter_num}: Analyzing Break Points ===")
     print(f"Audio: {audio_file.name}")
     print()
 
+    # Decode the whole chapter once; each pause analysis is a slice of it
+    all_samples, sr = get_samples(audio_file)
+
     results = []
+    clips = []
 
-    for i, pause in enumerate(top_pauses[:5]):  # Top 5 longest pauses
+    for i, pause in enumerate(top_pauses):  # Top 5 longest pauses
         pause_start = pause['start']
         pause_end = pause['end']
 
@@ -172,9 +244,11 @@ def analyze_chapter(chapter_num: str):
         print(f"  Before: \"{pause['before_word']}\"")
 
         # Get samples
-        samples, sr = get_samples(audio_file, analysis_start, analysis_duration)
+        samples = None
+        if all_samples is not None:
+            samples = all_samples[int(analysis_start * sr):int((analysis_start + analysis_duration) * sr)]
 
-        if samples:
+        if samples is not None and len(samples):
             # Find silence regions
             silences = find_silence_regions(samples, sr, threshold=800)
 
@@ -211,8 +285,8 @@ def analyze_chapter(chapter_num: str):
             else:
                 print(f"  No clean silence found, using zero-crossings...")
                 # Fall back to zero-crossing near the pause
-                crossings = find_zero_crossings(samples, sr)
                 target_sample = int(target_offset * sr)
+                crossings = find_zero_crossings(samples, sr, target_sample=target_sample)
 
                 # Find crossing with lowest energy near target
                 nearby = [c for c in crossings if abs(c['sample'] - target_sample) < sr * 0.2]  # within 200ms
@@ -231,10 +305,12 @@ def analyze_chapter(chapter_num: str):
         # Extract sample clip for review (5 seconds around pause)
         clip_start = max(0, pause_start - 2.5)
         clip_path = output_dir / f"ch{chapter_num}-break{i+1}-at-{pause_start:.0f}s.mp3"
-        extract_sample_clip(audio_file, clip_path, clip_start, 5.0)
+        clips.append((clip_path, clip_start, 5.0))
         print(f"  Sample: {clip_path.name}")
         print()
 
+    extract_sample_clips(audio_file, clips)
+
     # Save results
     results_file = output_dir / f"chapter-{chapter_num}-break-analysis.json"
     with open(results_file, 'w') as f:
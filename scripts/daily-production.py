@@ -19,10 +19,16 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import os
+import re
 import subprocess
 import sys
-from dataclasses import asdict, dataclass
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
@@ -30,7 +36,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root / "src"))
 
-from simulacrum.generation.scenes import SceneGenerator, WorldState
+from simulacrum.generation.scenes import Character, SceneGenerator, WorldState
 from simulacrum.generation.world import WorldGenerator
 from simulacrum.generation.signals import NarrativeConverter, RelationshipSignalExtractor
 
@@ -50,6 +56,13 @@ except ImportError:
     HAS_COST_TRACKING = False
     CostCalculator = None
 
+# Faster JSON parsing for world files (optional)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import series-specific signal filtering
 try:
     from simulacrum.generation.filters import get_series_context, get_signals_for_series
@@ -66,6 +79,53 @@ except ImportError:
 SERIES_REGISTRY = project_root / "data" / "simulacrum-series.json"
 ARTIST_NAME = "Simulacrum Stories"
 GENRE = "Audio Drama"
+DOC_TO_AUDIO_SCRIPT = os.fspath(project_root / "scripts" / "doc-to-audio.py")
+
+# Fixed parts of the final episode ffmpeg command; only per-episode
+# metadata is spliced in by _generate_audio
+_FF_INPUT_FLAGS = ("ffmpeg", "-y", "-f", "mp3", "-i", "pipe:0")
+# doc-to-audio already emits mp3; remux the stream instead of decoding and
+# re-encoding it (lossy and CPU-bound)
+_FF_AUDIO_FLAGS = ("-c:a", "copy")
+# Map audio + artwork (second input) and tag the picture as the front cover
+_FF_ARTWORK_FLAGS = (
+    "-map",
+    "0:a",
+    "-map",
+    "1:v",
+    "-c:v",
+    "copy",
+    "-id3v2_version",
+    "3",
+    "-metadata:s:v",
+    "title=Album cover",
+    "-metadata:s:v",
+    "comment=Cover (front)",
+)
+_FF_STATIC_METADATA = (
+    "-metadata",
+    f"artist={ARTIST_NAME}",
+    "-metadata",
+    f"album_artist={ARTIST_NAME}",
+    "-metadata",
+    f"genre={GENRE}",
+    "-metadata",
+    "date=2025",
+)
+
+# First top-level "# Title" heading of a generated scene
+_TITLE_RE = re.compile(r"^# (.*)$", re.MULTILINE)
+
+# Voice tags stripped from the scene when building embedded lyrics:
+#   <VOICE:NARRATOR>text</VOICE:NARRATOR>               -> [Narrator] text
+#   <VOICE:CHARACTER_Name tone="x">text</VOICE:...Name> -> [Name, x] text
+# DOTALL so tags whose text wraps across lines still match.
+_LYRICS_RE = re.compile(
+    r"<VOICE:NARRATOR>(?P<nar>.*?)</VOICE:NARRATOR>"
+    r'|<VOICE:CHARACTER_(?P<name>\w+)(?:\s+tone="(?P<tone>[^"]*)")?>'
+    r"(?P<txt>.*?)</VOICE:CHARACTER_(?P=name)>",
+    re.DOTALL,
+)
 
 
 @dataclass
@@ -85,6 +145,28 @@ class SeriesState:
     last_episode_at: str | None = None
 
 
+def _read_json(path: str) -> dict:
+    """Parse a JSON file, using orjson when it is installed"""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_world(world_file: str, mtime: float) -> WorldState:
+    """Load and parse a world file
+
+    Cached on (path, mtime) so repeated episodes from the same world skip
+    the JSON parse, while edits to the file are still picked up.
+    """
+    return WorldState.from_json(_read_json(world_file))
+
+
+@functools.lru_cache(maxsize=16)
+def _world_index(world_file: str, mtime: float) -> dict[str, Character]:
+    """Characters of a world file by name, cached like _load_world()"""
+    return {c.name: c for c in _load_world(world_file, mtime).characters}
+
+
 # =============================================================================
 # Series Manager
 # =============================================================================
@@ -100,15 +182,16 @@ class SeriesManager:
 
     def _load_registry(self) -> dict[str, SeriesState]:
         if self.registry_path.exists():
-            with open(self.registry_path) as f:
-                data = json.load(f)
-                return {name: SeriesState(**state) for name, state in data.items()}
+            data = json.loads(self.registry_path.read_bytes())
+            return {name: SeriesState(**state) for name, state in data.items()}
         return {}
 
     def _save_registry(self) -> None:
+        # SeriesState is flat (only str/int/list fields), so __dict__ serializes
+        # identically to asdict() without its recursive deep copy
         with open(self.registry_path, "w") as f:
             json.dump(
-                {name: asdict(state) for name, state in self.series.items()},
+                {name: vars(state) for name, state in self.series.items()},
                 f,
                 indent=2,
             )
@@ -150,11 +233,19 @@ class SeriesManager:
         return list(self.series.values())
 
     def update_episode_count(self, name: str) -> None:
-        state = self.series.get(name.lower())
-        if state:
-            state.episode_count += 1
-            state.last_pov_index = (state.last_pov_index + 1) % len(state.pov_rotation)
-            state.last_episode_at = datetime.now().isoformat()
+        self.update_episode_counts([name])
+
+    def update_episode_counts(self, names: list[str]) -> None:
+        """Advance several series by one episode with a single registry write"""
+        updated = False
+        for name in names:
+            state = self.series.get(name.lower())
+            if state:
+                state.episode_count += 1
+                state.last_pov_index = (state.last_pov_index + 1) % len(state.pov_rotation)
+                state.last_episode_at = datetime.now().isoformat()
+                updated = True
+        if updated:
             self._save_registry()
 
 
@@ -168,7 +259,19 @@ class EpisodeProducer:
 
     def __init__(self, output_base: Path):
         self.output_base = output_base
-        self.scene_gen = SceneGenerator()
+        # Resolved artwork per (album dir, series); avoids rescanning and
+        # regenerating the placeholder for every episode
+        self._artwork_cache: dict[tuple[str, str], Path | None] = {}
+
+    @functools.cached_property
+    def scene_gen(self) -> SceneGenerator:
+        """Single-pass generator, built on first use"""
+        return SceneGenerator()
+
+    @functools.cached_property
+    def multipass_gen(self) -> "MultiPassSceneGenerator":
+        """Multi-pass generator, built once and reused across episodes"""
+        return MultiPassSceneGenerator()
 
     def get_next_pov(self, state: SeriesState) -> str:
         """Get the next POV character in rotation"""
@@ -208,10 +311,10 @@ class EpisodeProducer:
             provider: TTS provider (macos, openai, elevenlabs)
         """
 
-        # Load world
-        with open(state.world_file) as f:
-            world_data = json.load(f)
-        world = WorldState.from_json(world_data)
+        # Load world (cached while the file is unchanged)
+        world_mtime = os.path.getmtime(state.world_file)
+        world = _load_world(state.world_file, world_mtime)
+        characters = _world_index(state.world_file, world_mtime)
 
         # Extract series-specific relationship signals for emotional depth
         relationship_context = None
@@ -256,8 +359,7 @@ class EpisodeProducer:
                 file=sys.stderr,
             )
 
-            multipass_gen = MultiPassSceneGenerator()
-            scene, metadata = multipass_gen.generate_episode(
+            scene, metadata = self.multipass_gen.generate_episode(
                 world=world,
                 template_suggestion=template,
                 context=base_context,
@@ -308,11 +410,8 @@ class EpisodeProducer:
             metadata = {}
 
         # Extract title from scene (first # heading)
-        title = "Untitled Episode"
-        for line in scene.split("\n"):
-            if line.startswith("# "):
-                title = line[2:].strip()
-                break
+        title_match = _TITLE_RE.search(scene)
+        title = title_match.group(1).strip() if title_match else "Untitled Episode"
 
         # Save scene markdown
         scene_file = output_dir / f"E{episode_num:02d}-scene.md"
@@ -335,6 +434,7 @@ class EpisodeProducer:
         use_mixing = use_multipass and provider != "macos"
         audio_file = self._generate_audio(
             scene_file=scene_file,
+            scene_text=scene,
             output_dir=output_dir,
             series_name=state.name,
             episode_num=episode_num,
@@ -342,6 +442,7 @@ class EpisodeProducer:
             arc=state.current_arc,
             pov=primary_pov,
             world=world,
+            characters=characters,
             use_advanced_mixing=use_mixing,
             provider=provider,
             cost_info=cost_info,
@@ -349,9 +450,22 @@ class EpisodeProducer:
 
         return audio_file
 
-    def _select_narrator_voice(self, pov_name: str, world: WorldState, provider: str) -> str:
-        """Select narrator voice based on POV character gender and provider"""
-        pov_char = next((c for c in world.characters if c.name == pov_name), None)
+    def _select_narrator_voice(
+        self,
+        pov_name: str,
+        world: WorldState,
+        provider: str,
+        characters: dict[str, Character] | None = None,
+    ) -> str:
+        """Select narrator voice based on POV character gender and provider
+
+        ``characters`` is an optional name index of ``world`` (see
+        _world_index); without it the characters are scanned.
+        """
+        if characters is not None:
+            pov_char = characters.get(pov_name)
+        else:
+            pov_char = next((c for c in world.characters if c.name == pov_name), None)
         is_female = pov_char and pov_char.gender == "female"
 
         # Provider-specific voice mapping
@@ -367,6 +481,7 @@ class EpisodeProducer:
     def _generate_audio(
         self,
         scene_file: Path,
+        scene_text: str,
         output_dir: Path,
         series_name: str,
         episode_num: int,
@@ -374,27 +489,25 @@ class EpisodeProducer:
         arc: str,
         pov: str,
         world: WorldState,
+        characters: dict[str, Character] | None = None,
         use_advanced_mixing: bool = False,
         provider: str = "macos",
         cost_info=None,
     ) -> Path:
         """Generate audio with proper metadata, artwork, and lyrics"""
 
-        # Run doc-to-audio
-        temp_dir = output_dir / "temp"
-        temp_dir.mkdir(exist_ok=True)
-
         # Select narrator voice based on POV gender and provider
-        narrator_voice = self._select_narrator_voice(pov, world, provider)
+        narrator_voice = self._select_narrator_voice(pov, world, provider, characters)
 
-        # Build doc-to-audio command with optional advanced mixing
+        # Build doc-to-audio command with optional advanced mixing.
+        # Audio is written to stdout and piped straight into ffmpeg below.
         doc_to_audio_cmd = [
             sys.executable,
-            str(project_root / "scripts" / "doc-to-audio.py"),
+            DOC_TO_AUDIO_SCRIPT,
             "--input",
-            str(scene_file),
+            scene_file,
             "--output",
-            str(temp_dir),
+            "-",
             "--provider",
             provider,
             "--multi-voice",
@@ -411,94 +524,40 @@ class EpisodeProducer:
                 # Note: normalization is enabled by default with --advanced-mixing
             ])
 
-        subprocess.run(doc_to_audio_cmd, capture_output=True, check=True)
-
-        # Find generated file
-        raw_audio = list(temp_dir.glob("*.mp3"))[0]
-
         # Extract lyrics (scene text without voice tags)
-        scene_text = scene_file.read_text()
         lyrics = self._extract_lyrics(scene_text)
 
-        # Save lyrics to temp file for embedding
-        lyrics_file = temp_dir / "lyrics.txt"
-        lyrics_file.write_text(lyrics)
-
         # Get or create album artwork
         artwork_file = self._get_artwork(output_dir, series_name)
 
-        # Re-encode with full metadata including artwork and lyrics
+        # Remux with full metadata including artwork and lyrics
         album_name = f"{series_name} Chronicles: {arc}"
         final_name = f"E{episode_num:02d} - {title}.mp3"
         final_path = output_dir / final_name
 
-        # Build ffmpeg command
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-i",
-            str(raw_audio),
+        # Build ffmpeg command (TTS audio arrives on stdin). Paths are passed
+        # as-is; subprocess converts path-like arguments itself.
+        has_artwork = artwork_file is not None and artwork_file.exists()
+        cmd = list(_FF_INPUT_FLAGS)
+        if has_artwork:
+            cmd += ["-i", artwork_file]
+        cmd += _FF_AUDIO_FLAGS
+        if has_artwork:
+            cmd += _FF_ARTWORK_FLAGS
+        cmd += _FF_STATIC_METADATA
+        cmd += [
+            "-metadata",
+            f"title={title}",
+            "-metadata",
+            f"album={album_name}",
+            "-metadata",
+            f"track={episode_num}",
+            "-metadata",
+            f"comment=POV: {pov}",
+            "-metadata",
+            f"lyrics={lyrics[:3000]}",  # Truncate if too long
         ]
 
-        # Add artwork if available
-        if artwork_file and artwork_file.exists():
-            cmd.extend(["-i", str(artwork_file)])
-
-        cmd.extend(
-            [
-                "-acodec",
-                "libmp3lame",
-                "-b:a",
-                "192k",
-                "-ar",
-                "44100",
-                "-ac",
-                "2",
-            ]
-        )
-
-        # Map streams (audio + artwork if present)
-        if artwork_file and artwork_file.exists():
-            cmd.extend(
-                [
-                    "-map",
-                    "0:a",
-                    "-map",
-                    "1:v",
-                    "-c:v",
-                    "copy",
-                    "-id3v2_version",
-                    "3",
-                    "-metadata:s:v",
-                    "title=Album cover",
-                    "-metadata:s:v",
-                    "comment=Cover (front)",
-                ]
-            )
-
-        cmd.extend(
-            [
-                "-metadata",
-                f"title={title}",
-                "-metadata",
-                f"artist={ARTIST_NAME}",
-                "-metadata",
-                f"album={album_name}",
-                "-metadata",
-                f"album_artist={ARTIST_NAME}",
-                "-metadata",
-                f"track={episode_num}",
-                "-metadata",
-                f"genre={GENRE}",
-                "-metadata",
-                "date=2025",
-                "-metadata",
-                f"comment=POV: {pov}",
-                "-metadata",
-                f"lyrics={lyrics[:3000]}",  # Truncate if too long
-            ]
-        )
-
         # Add cost information to metadata
         if cost_info:
             cmd.extend([
@@ -506,57 +565,72 @@ class EpisodeProducer:
                 f"copyright=Production Cost: ${cost_info.total_cost_usd:.4f} (LLM: ${cost_info.llm_cost_usd:.4f}, TTS: ${cost_info.tts_cost_usd:.4f})",
             ])
 
-        cmd.append(str(final_path))
+        cmd.append(final_path)
 
-        subprocess.run(cmd, capture_output=True, check=True)
-
-        # Cleanup temp
-        import shutil
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+        # Run doc-to-audio and ffmpeg as one streaming pipeline. doc-to-audio's
+        # progress output goes to a temp file rather than a second pipe (nothing
+        # to drain while ffmpeg runs) and is only read back if it fails.
+        with tempfile.TemporaryFile() as tts_err:
+            tts = subprocess.Popen(doc_to_audio_cmd, stdout=subprocess.PIPE, stderr=tts_err)
+            ffmpeg = subprocess.Popen(
+                cmd, stdin=tts.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+            tts.stdout.close()  # ffmpeg owns the read end now
+            _, ffmpeg_err = ffmpeg.communicate()
+            tts.wait()
+            tts_err.seek(0)
+            tts_stderr = tts_err.read()
+
+        # One side failing usually takes the other down too (a dead ffmpeg
+        # breaks doc-to-audio's pipe), so check ffmpeg first and keep both
+        # stderrs on the error either way
+        stderr = b"ffmpeg:\n" + ffmpeg_err + b"\ndoc-to-audio:\n" + tts_stderr
+        if ffmpeg.returncode:
+            raise subprocess.CalledProcessError(ffmpeg.returncode, cmd, stderr=stderr)
+        if tts.returncode:
+            raise subprocess.CalledProcessError(tts.returncode, doc_to_audio_cmd, stderr=stderr)
 
         return final_path
 
     def _extract_lyrics(self, scene_text: str) -> str:
         """Extract readable lyrics from scene markdown"""
-        import re
-
-        lines = []
-        for line in scene_text.split("\n"):
-            # Skip metadata lines
-            if line.startswith("**") or line.startswith("---") or line.startswith("#"):
-                continue
-
-            # Extract content from voice tags
-            # <VOICE:NARRATOR>text</VOICE:NARRATOR> -> [Narrator] text
-            narrator_match = re.search(r"<VOICE:NARRATOR>(.*?)</VOICE:NARRATOR>", line)
-            if narrator_match:
-                lines.append(f"[Narrator] {narrator_match.group(1)}")
-                continue
-
-            # <VOICE:CHARACTER_Name tone="x">text</VOICE> -> [Name] text
-            char_match = re.search(
-                r'<VOICE:CHARACTER_(\w+)(?:\s+tone="([^"]*)")?>(.*?)</VOICE:CHARACTER_\1>',
-                line,
+        return "\n".join(self._iter_lyric_lines(scene_text))
+
+    def _iter_lyric_lines(self, scene_text: str) -> Iterator[str]:
+        """Yield lyric lines: tagged speech as "[Speaker] text", other prose as-is"""
+        # Skip metadata lines up front so one tag scan covers the prose
+        body = "\n".join(
+            line
+            for line in scene_text.split("\n")
+            if not line.startswith(("**", "---", "#"))
+        )
+
+        pos = 0
+        for match in _LYRICS_RE.finditer(body):
+            # Keep non-empty untagged lines between voice tags
+            yield from (
+                line.strip() for line in body[pos : match.start()].split("\n") if line.strip()
             )
-            if char_match:
-                name = char_match.group(1)
-                tone = char_match.group(2)
-                text = char_match.group(3)
-                if tone:
-                    lines.append(f"[{name}, {tone}] {text}")
-                else:
-                    lines.append(f"[{name}] {text}")
-                continue
-
-            # Keep non-empty lines
-            if line.strip():
-                lines.append(line.strip())
-
-        return "\n".join(lines)
+            pos = match.end()
+
+            if match["nar"] is not None:
+                yield f"[Narrator] {match['nar']}"
+            elif match["tone"]:
+                yield f"[{match['name']}, {match['tone']}] {match['txt']}"
+            else:
+                yield f"[{match['name']}] {match['txt']}"
+
+        yield from (line.strip() for line in body[pos:].split("\n") if line.strip())
 
     def _get_artwork(self, output_dir: Path, series_name: str) -> Path | None:
         """Get or create album artwork"""
+        key = (str(output_dir), series_name)
+        if key not in self._artwork_cache:
+            self._artwork_cache[key] = self._find_artwork(output_dir, series_name)
+        return self._artwork_cache[key]
+
+    def _find_artwork(self, output_dir: Path, series_name: str) -> Path | None:
+        """Locate existing artwork, generating a placeholder if there is none"""
         # Check for existing artwork
         artwork_patterns = [
             "cover.jpg",
@@ -565,15 +639,20 @@ class EpisodeProducer:
             "artwork.png",
             "folder.jpg",
         ]
+        # One directory read instead of a stat per candidate name
+        try:
+            with os.scandir(output_dir) as it:
+                names = {entry.name.lower(): entry.name for entry in it}
+        except FileNotFoundError:
+            names = {}
         for pattern in artwork_patterns:
-            artwork = output_dir / pattern
-            if artwork.exists():
-                return artwork
+            if pattern in names:
+                return output_dir / names[pattern]
 
         # Check in series data directory
         data_dir = Path.home() / "devvyn-meta-project" / "data" / "artwork"
         series_artwork = data_dir / f"{series_name.lower()}.jpg"
-        if series_artwork.exists():
+        if series_artwork.is_file():
             return series_artwork
 
         # Generate placeholder artwork (simple colored square with text)
@@ -587,7 +666,7 @@ class EpisodeProducer:
         # Try to create with ffmpeg (generates solid color with text overlay)
         try:
             # Generate a 500x500 dark gradient background with series name
-            subprocess.run(
+            _run_quiet(
                 [
                     "ffmpeg",
                     "-y",
@@ -599,10 +678,8 @@ class EpisodeProducer:
                     f"drawtext=text='{series_name}':fontsize=48:fontcolor=white:x=(w-text_w)/2:y=(h-text_h)/2",
                     "-frames:v",
                     "1",
-                    str(artwork_path),
-                ],
-                capture_output=True,
-                check=True,
+                    artwork_path,
+                ]
             )
             return artwork_path
         except Exception:
@@ -611,6 +688,41 @@ class EpisodeProducer:
         return None
 
 
+def _run_quiet(cmd: list[str | Path]) -> None:
+    """Run a command, discarding stdout and keeping stderr only for errors"""
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if result.returncode:
+        raise subprocess.CalledProcessError(result.returncode, cmd, stderr=result.stderr)
+
+
+# The worker process's producer, set up once by _init_worker
+_worker_producer: EpisodeProducer | None = None
+
+
+def _init_worker(output_base: str) -> None:
+    """Build the producer each --all worker reuses for all of its episodes
+
+    Built inside the worker so generator clients never need to be pickled,
+    and kept for the worker's lifetime so its generators and artwork cache
+    carry over from one episode to the next.
+    """
+    global _worker_producer
+    _worker_producer = EpisodeProducer(Path(output_base))
+
+
+def _produce_one(state_data: dict, album_dir: str, provider: str) -> Path:
+    """Produce one episode in a worker process (used by --all)
+
+    Only plain state data crosses the process boundary.
+    """
+    if _worker_producer is None:
+        raise RuntimeError("_produce_one must run in a pool built with _init_worker")
+    state = SeriesState(**state_data)
+    # Printed by the worker so the heading precedes this series' own output
+    print(f"\n=== {state.name} ===", file=sys.stderr)
+    return _worker_producer.produce_episode(state, Path(album_dir), provider=provider)
+
+
 # =============================================================================
 # CLI
 # =============================================================================
@@ -676,8 +788,7 @@ def main():
         # Generate or use existing world
         if args.world:
             world_file = args.world
-            with open(world_file) as f:
-                world_data = json.load(f)
+            world_data = _read_json(world_file)
         else:
             # Generate new world with real signals
             print("  Generating world...", file=sys.stderr)
@@ -764,18 +875,49 @@ def main():
             print("No active series. Use --init to create one.")
             return
 
-        producer = EpisodeProducer(output_base)
+        # Series are independent (own album dir, own state), so produce them
+        # concurrently. Registry updates stay in this process and are written
+        # once at the end (even if a worker crashes the pool).
+        completed = []
+        failed = []
+        max_workers = min(len(series_list), os.cpu_count() or 1)
+        if args.provider == "elevenlabs":
+            # Each doc-to-audio already uses the account's full ElevenLabs
+            # concurrency; parallel series would only multiply it
+            max_workers = 1
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(str(output_base),),
+            ) as executor:
+                futures = {}
+                for state in series_list:
+                    album_dir = output_base / f"{state.name} Chronicles"
+                    album_dir.mkdir(parents=True, exist_ok=True)
+
+                    future = executor.submit(
+                        _produce_one, vars(state), str(album_dir), args.provider
+                    )
+                    futures[future] = state
 
-        for state in series_list:
-            print(f"\n=== {state.name} ===", file=sys.stderr)
+                for future in as_completed(futures):
+                    state = futures[future]
+                    try:
+                        audio_file = future.result()
+                    except Exception as e:
+                        print(f"  ❌ {state.name}: {e}", file=sys.stderr)
+                        failed.append(state.name)
+                        continue
 
-            album_dir = output_base / f"{state.name} Chronicles"
-            album_dir.mkdir(parents=True, exist_ok=True)
+                    completed.append(state.name.lower())
 
-            audio_file = producer.produce_episode(state, album_dir, provider=args.provider)
-            manager.update_episode_count(state.name.lower())
+                    print(f"  ✅ {audio_file.name}", file=sys.stderr)
+        finally:
+            manager.update_episode_counts(completed)
 
-            print(f"  ✅ {audio_file.name}", file=sys.stderr)
+        if failed:
+            sys.exit(1)
 
 
 if __name__ == "__main__":
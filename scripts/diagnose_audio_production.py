@@ -20,15 +20,177 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import mmap
+import os
+import re
 import subprocess
 import sys
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
 import struct
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# === MP3 FRAME HEADERS ===
+# Tables are indexed by the 2-bit MPEG version field (0 = 2.5, 1 = reserved,
+# 2 = MPEG 2, 3 = MPEG 1) and layer number (1-3).
+
+_MP3_SAMPLE_RATES = (
+    (11025, 12000, 8000),
+    None,
+    (22050, 24000, 16000),
+    (44100, 48000, 32000),
+)
+
+# kbps by (is_mpeg1, layer); index 0 ("free") and 15 (bad) are rejected
+_MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+
+_MP3_SAMPLES_PER_FRAME = {
+    (True, 1): 384, (True, 2): 1152, (True, 3): 1152,
+    (False, 1): 384, (False, 2): 1152, (False, 3): 576,
+}
+
+# Bytes read after the ID3v2 tag when looking for the first frame
+_MP3_SCAN_BYTES = 8192
+
+# Precompiled layouts: a frame header / syncsafe size is one big-endian
+# word; a Xing/Info tag is the magic, flags and frame count in one read
+_MP3_WORD = struct.Struct(">I")
+_MP3_XING = struct.Struct(">4sII")
+
+
+@functools.lru_cache(maxsize=256)
+def _mp3_frame_info(word: int) -> Optional[tuple]:
+    """Decode a 32-bit MPEG audio frame header.
+
+    Cached because a file's frames (and a catalogue's files) share a
+    handful of distinct headers. Returns (bitrate_bps, sample_rate, samples_per_frame, frame_length,
+    xing_offset) or None if the word is not a usable frame header.
+    """
+    if (word >> 21) & 0x7FF != 0x7FF:
+        return None
+
+    version = (word >> 19) & 3
+    layer = 4 - ((word >> 17) & 3)
+    bitrate_index = (word >> 12) & 0xF
+    rate_index = (word >> 10) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+
+    mpeg1 = version == 3
+    bitrate = _MP3_BITRATES[mpeg1, layer][bitrate_index] * 1000
+    sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+    samples = _MP3_SAMPLES_PER_FRAME[mpeg1, layer]
+    padding = (word >> 9) & 1
+
+    if layer == 1:
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        length = samples // 8 * bitrate // sample_rate + padding
+
+    # Xing/Info tags sit after the header and Layer III side info
+    mono = (word >> 6) & 3 == 3
+    if mpeg1:
+        xing_offset = 4 + (17 if mono else 32)
+    else:
+        xing_offset = 4 + (9 if mono else 17)
+
+    return bitrate, sample_rate, samples, length, xing_offset
+
+
+def _parse_mp3_duration(
+    filepath: Path, f: Optional[BinaryIO] = None, file_size: Optional[int] = None
+) -> Optional[float]:
+    """Read MP3 duration from frame headers without decoding.
+
+    Uses the Xing/Info or VBRI frame count when present, otherwise treats
+    the stream as CBR. Returns None when that is not possible (no frame
+    sync, free-format bitrate, or VBR without a frame count header).
+    Pass an already-open binary handle as ``f`` to avoid reopening the file.
+    """
+    if f is None:
+        with open(filepath, "rb") as f:
+            return _parse_mp3_duration(filepath, f, file_size)
+
+    if file_size is None:
+        file_size = os.fstat(f.fileno()).st_size
+
+    # Skip an ID3v2 tag. Its size is a 28-bit syncsafe integer (7 bits per
+    # byte): unpack all four bytes as one word and squeeze out the zero
+    # high bits with masks and shifts instead of a per-byte loop.
+    f.seek(0)
+    head = f.read(10)
+    audio_start = 0
+    if len(head) == 10 and head[:3] == b"ID3":
+        (raw,) = _MP3_WORD.unpack_from(head, 6)
+        size = (
+            (raw & 0x7F)
+            | (raw & 0x7F00) >> 1
+            | (raw & 0x7F0000) >> 2
+            | (raw & 0x7F000000) >> 3
+        )
+        audio_start = 10 + size + (10 if head[5] & 0x10 else 0)
+
+    f.seek(audio_start)
+    buf = f.read(_MP3_SCAN_BYTES)
+
+    audio_end = file_size
+    if file_size >= audio_start + 128:
+        f.seek(-128, os.SEEK_END)
+        if f.read(3) == b"TAG":
+            audio_end -= 128
+
+    # Find the first valid frame header
+    pos = buf.find(b"\xff")
+    while 0 <= pos <= len(buf) - 4:
+        info = _mp3_frame_info(_MP3_WORD.unpack_from(buf, pos)[0])
+        if info:
+            break
+        pos = buf.find(b"\xff", pos + 1)
+    else:
+        return None
+
+    bitrate, sample_rate, samples, length, xing_offset = info
+
+    # VBR frame count from the Xing/Info (LAME) or VBRI (Fraunhofer) header
+    xing = pos + xing_offset
+    if buf[xing : xing + 4] in (b"Xing", b"Info") and len(buf) >= xing + _MP3_XING.size:
+        _, flags, frames = _MP3_XING.unpack_from(buf, xing)
+        if flags & 1:
+            return frames * samples / sample_rate
+    elif buf[pos + 36 : pos + 40] == b"VBRI" and len(buf) >= pos + 54:
+        (frames,) = _MP3_WORD.unpack_from(buf, pos + 50)
+        return frames * samples / sample_rate
+
+    # No frame count: only trust a CBR estimate if the next frame agrees
+    following = pos + length
+    if following + 4 <= len(buf):
+        next_info = _mp3_frame_info(_MP3_WORD.unpack_from(buf, following)[0])
+        if next_info is None or next_info[0] != bitrate:
+            return None
+
+    return (audio_end - audio_start - pos) * 8 / bitrate
+
 
 # === TELEMETRY SCHEMA ===
 # Shared pattern with herbarium-specimen-tools
@@ -41,6 +203,14 @@ class TelemetryEvent:
     data: Dict[str, Any]
     duration_ms: Optional[float] = None
 
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "data": self.data,
+            "duration_ms": self.duration_ms,
+        }
+
 
 @dataclass
 class AudioCheckpoint:
@@ -55,6 +225,19 @@ class AudioCheckpoint:
     tests_in_checkpoint: int = 0
     failures_in_checkpoint: int = 0
 
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "timestamp": self.timestamp,
+            "files_checked": self.files_checked,
+            "manifest_state": self.manifest_state,
+            "budget_state": self.budget_state,
+            "notes": self.notes,
+            "passed": self.passed,
+            "tests_in_checkpoint": self.tests_in_checkpoint,
+            "failures_in_checkpoint": self.failures_in_checkpoint,
+        }
+
 
 @dataclass
 class DiagnosticSession:
@@ -76,10 +259,40 @@ class DiagnosticSession:
     audio_files_validated: int = 0
     total_audio_duration_sec: float = 0
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Telemetry form: summary fields first, then the event collections.
+
+        Built directly rather than with dataclasses.asdict(), which deep-copies
+        every nested record.
+        """
+        return {
+            "session_id": self.session_id,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "series": self.series,
+            "total_duration_ms": self.total_duration_ms,
+            "tests_passed": self.tests_passed,
+            "tests_failed": self.tests_failed,
+            "audio_files_validated": self.audio_files_validated,
+            "total_audio_duration_sec": self.total_audio_duration_sec,
+            "checkpoints": [c.as_dict() for c in self.checkpoints],
+            "errors": [e.as_dict() for e in self.errors],
+            "warnings": [w.as_dict() for w in self.warnings],
+        }
+
 
 class AudioDiagnosticRunner:
     """Diagnostic runner for audio production QA."""
 
+    # Player integration markers every chapter page must reference; group N
+    # of the pattern corresponds to label N-1
+    _CHAPTER_MARKERS_RE = re.compile(
+        rb"(/css/chapter-player\.css)|(/js/chapter-player\.js)"
+        rb"|(/js/error-tracker\.js)|(/favicon\.svg)"
+    )
+    _CHAPTER_MARKER_LABELS = ("CSS", "JS", "error-tracker", "favicon")
+    _ALL_CHAPTER_MARKERS = (1 << len(_CHAPTER_MARKER_LABELS)) - 1
+
     def __init__(
         self,
         series: str = "all",
@@ -97,27 +310,45 @@ class AudioDiagnosticRunner:
         self.manifest_path = self.site_dir / "js" / "audio-manifest.json"
         self.output_dir = self.project_root / "output" / "diagnostics"
 
-        # Session setup
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Session setup. Event timestamps are derived from this one wall-clock
+        # reading plus the monotonic clock, so recording an event never has
+        # to query and convert local time.
+        self._t0_wall = datetime.now()
+        self._t0_mono = time.monotonic()
+        self.session_id = self._t0_wall.strftime("%Y%m%d_%H%M%S")
         self.session_dir = self.output_dir / f"session_{self.session_id}"
         self.session_dir.mkdir(parents=True, exist_ok=True)
 
         self.session = DiagnosticSession(
             session_id=self.session_id,
-            started_at=datetime.now().isoformat(),
+            started_at=self._t0_wall.isoformat(),
             series=series,
         )
 
-        self._start_time: Optional[float] = None
+        self._start_ns: Optional[int] = None
         self._current_checkpoint: Optional[AudioCheckpoint] = None
 
+        # MP3 durations by absolute path; each file is probed at most once
+        # even though two checkpoints ask for it
+        self._duration_cache: Dict[str, Optional[float]] = {}
+
+        # Durations from earlier runs: path -> [mtime_ns, size, duration].
+        # Entries are reused only while the file's mtime and size match.
+        self._saved_durations_path = self.output_dir / ".duration_cache.json"
+        self._saved_durations = self._load_saved_durations()
+        self._saved_durations_dirty = False
+
+        # *.mp3 entries in audio_dir, listed once and shared by checkpoints
+        self._audio_entries: Optional[List[os.DirEntry]] = None
+        self._audio_names: Optional[frozenset] = None
+
     def _timestamp(self) -> str:
-        return datetime.now().isoformat()
+        elapsed = timedelta(seconds=time.monotonic() - self._t0_mono)
+        return (self._t0_wall + elapsed).isoformat()
 
     def _elapsed_ms(self) -> float:
-        if self._start_time:
-            import time
-            return (time.time() - self._start_time) * 1000
+        if self._start_ns is not None:
+            return (time.monotonic_ns() - self._start_ns) / 1_000_000
         return 0
 
     def _log(self, msg: str, level: str = "info"):
@@ -201,10 +432,90 @@ class AudioDiagnosticRunner:
             duration_ms=self._elapsed_ms(),
         ))
 
-    def get_mp3_duration(self, filepath: Path) -> Optional[float]:
-        """Get MP3 duration in seconds using ffprobe or file analysis."""
+    def get_mp3_duration(
+        self,
+        filepath: Path,
+        st: Optional[os.stat_result] = None,
+        f: Optional[BinaryIO] = None,
+    ) -> Optional[float]:
+        """Get MP3 duration in seconds (cached per file).
+
+        Pass ``st`` when the file's stat is already known (e.g. from a
+        scandir entry) and ``f`` when the file is already open, to avoid
+        another stat call or open.
+        """
+        # abspath is string-only (no per-component lstat like resolve())
+        key = os.path.abspath(filepath)
+        if key in self._duration_cache:
+            return self._duration_cache[key]
+
+        try:
+            if st is None:
+                st = os.stat(key)
+            stamp = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamp = None
+
+        saved = self._saved_durations.get(key)
+        if stamp and saved and saved[:2] == stamp:
+            duration = saved[2]
+        else:
+            duration = self._probe_mp3_duration(filepath, st, f)
+            if duration is None:
+                # Size-based estimates are never persisted, so the next
+                # run probes the file again
+                duration = self._estimate_mp3_duration(filepath, st)
+            elif stamp:
+                self._saved_durations[key] = [*stamp, duration]
+                self._saved_durations_dirty = True
+
+        self._duration_cache[key] = duration
+        return duration
+
+    def _load_saved_durations(self) -> Dict[str, List]:
+        """Load the persisted duration cache (empty if missing or corrupt)."""
+        try:
+            return json.loads(self._saved_durations_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_durations(self):
+        """Persist newly probed durations, replacing the cache atomically.
+
+        Entries for files that no longer exist are dropped first. Write failures
+        are recorded as warnings rather than aborting the run.
+        """
+        for path in [p for p in self._saved_durations if not os.path.exists(p)]:
+            del self._saved_durations[path]
+            self._saved_durations_dirty = True
+        if not self._saved_durations_dirty:
+            return
+        tmp_path = self._saved_durations_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._saved_durations))
+            os.replace(tmp_path, self._saved_durations_path)
+        except OSError as e:
+            # The cache is only an optimization; never lose the diagnostic report over it
+            self.warn(f"Could not save duration cache: {e}",
+                      {"path": str(self._saved_durations_path)})
+
+    def _probe_mp3_duration(
+        self,
+        filepath: Path,
+        st: Optional[os.stat_result] = None,
+        f: Optional[BinaryIO] = None,
+    ) -> Optional[float]:
+        """Get the exact MP3 duration in seconds from frame headers or ffprobe."""
+        # Frame headers give the duration without spawning a process
+        try:
+            duration = _parse_mp3_duration(filepath, f, st.st_size if st else None)
+        except (OSError, struct.error):
+            duration = None
+        if duration:
+            return duration
+
         try:
-            # Try ffprobe first
+            # Fall back to ffprobe (VBR without a frame count, odd streams)
             result = subprocess.run(
                 ["ffprobe", "-v", "error", "-show_entries", "format=duration",
                  "-of", "default=noprint_wrappers=1:nokey=1", str(filepath)],
@@ -217,55 +528,125 @@ class AudioDiagnosticRunner:
         except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
             pass
 
-        # Fallback: estimate from file size (rough approximation for 192kbps)
+        return None
+
+    def _estimate_mp3_duration(
+        self, filepath: Path, st: Optional[os.stat_result] = None
+    ) -> Optional[float]:
+        """Estimate MP3 duration in seconds from the file size."""
+        # Rough approximation for 192kbps
         try:
-            size_bytes = filepath.stat().st_size
+            size_bytes = (st or filepath.stat()).st_size
             # 192kbps = 24000 bytes/sec
             return size_bytes / 24000
         except Exception:
             return None
 
-    def validate_mp3(self, filepath: Path) -> Dict[str, Any]:
-        """Validate MP3 file and return metadata."""
+    def _validate_entry(self, entry: os.DirEntry) -> Dict[str, Any]:
+        """Validate a scandir entry, reusing its cached stat for size and duration."""
+        try:
+            st = entry.stat()
+        except OSError:
+            st = None
+        return self.validate_mp3(Path(entry.path), st)
+
+    def validate_mp3(
+        self, filepath: Path, st: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Validate MP3 file and return metadata.
+
+        ``st`` (e.g. ``DirEntry.stat()``) supplies the size without an fstat.
+        """
         result = {
-            "exists": filepath.exists(),
+            "exists": True,
             "size_bytes": 0,
             "duration_sec": None,
             "is_valid": False,
             "errors": [],
         }
 
-        if not result["exists"]:
+        # One open covers existence, size (fstat) and the header read
+        try:
+            f = open(filepath, "rb")
+        except FileNotFoundError:
+            result["exists"] = False
             result["errors"].append("File not found")
             return result
+        except OSError as e:
+            result["errors"].append(f"Read error: {e}")
+            return result
 
-        result["size_bytes"] = filepath.stat().st_size
+        with f:
+            if st is None:
+                st = os.fstat(f.fileno())
+            result["size_bytes"] = st.st_size
 
-        if result["size_bytes"] < 1000:
-            result["errors"].append("File too small (< 1KB)")
-            return result
+            if result["size_bytes"] < 1000:
+                result["errors"].append("File too small (< 1KB)")
+                return result
 
-        # Check MP3 header
-        try:
-            with open(filepath, "rb") as f:
-                header = f.read(3)
-                # Check for ID3 tag or MP3 sync word
-                if header[:3] == b"ID3" or (header[0] == 0xFF and (header[1] & 0xE0) == 0xE0):
+            # Check MP3 header
+            try:
+                header = f.read(4)
+                (word,) = _MP3_WORD.unpack_from(header)
+                # Check for ID3 tag or MP3 sync word (11 set bits)
+                if header[:3] == b"ID3" or word >> 21 == 0x7FF:
                     result["is_valid"] = True
                 else:
                     result["errors"].append("Invalid MP3 header")
-        except Exception as e:
-            result["errors"].append(f"Read error: {e}")
+            except Exception as e:
+                result["errors"].append(f"Read error: {e}")
 
-        if result["is_valid"]:
-            result["duration_sec"] = self.get_mp3_duration(filepath)
+            # Duration parsing reuses this handle rather than reopening
+            if result["is_valid"]:
+                result["duration_sec"] = self.get_mp3_duration(filepath, st, f)
 
         return result
 
+    def audio_entries(self) -> List[os.DirEntry]:
+        """MP3 directory entries in the audio directory, sorted by name."""
+        if self._audio_entries is None:
+            with os.scandir(self.audio_dir) as it:
+                self._audio_entries = sorted(
+                    # Skip dotfiles (e.g. AppleDouble ._E01.mp3) like glob did
+                    (
+                        entry
+                        for entry in it
+                        if entry.name.endswith(".mp3") and not entry.name.startswith(".")
+                    ),
+                    key=lambda entry: entry.name,
+                )
+        return self._audio_entries
+
+    def audio_names(self) -> frozenset:
+        """Names of the MP3 files in the audio directory."""
+        if self._audio_names is None:
+            self._audio_names = frozenset(entry.name for entry in self.audio_entries())
+        return self._audio_names
+
+    def _scan_chapter(self, chapter_file: Path) -> tuple:
+        """Return (file name, missing player markers) for a chapter page."""
+        # One regex pass over the raw bytes (mmap, no decode), noting which
+        # markers appear and stopping once all have been seen
+        found = 0
+        with open(chapter_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    for match in self._CHAPTER_MARKERS_RE.finditer(content):
+                        found |= 1 << (match.lastindex - 1)
+                        if found == self._ALL_CHAPTER_MARKERS:
+                            break
+
+        missing = [
+            label
+            for bit, label in enumerate(self._CHAPTER_MARKER_LABELS)
+            if not found & (1 << bit)
+        ]
+        return chapter_file.name, missing
+
     def run(self) -> DiagnosticSession:
         """Run the full diagnostic session."""
-        import time
-        self._start_time = time.time()
+        self._start_ns = time.monotonic_ns()
 
         print(f"\n{'#'*60}")
         print(f"# AUDIO PRODUCTION DIAGNOSTIC")
@@ -278,9 +659,10 @@ class AudioDiagnosticRunner:
             self._run_diagnostics()
         except Exception as e:
             self.error(f"Fatal error: {e}", {"type": type(e).__name__})
-            import traceback
             traceback.print_exc()
 
+        self._save_durations()
+
         # Finalize session
         self.session.ended_at = self._timestamp()
         self.session.total_duration_ms = self._elapsed_ms()
@@ -321,10 +703,12 @@ class AudioDiagnosticRunner:
                 self.test("Manifest has chapters", len(manifest) > 0, f"{len(manifest)} entries")
 
                 if self._current_checkpoint:
+                    # One pass: every entry is either pending or has audio
+                    pending = sum(v is None for v in manifest.values())
                     self._current_checkpoint.manifest_state = {
                         "total_entries": len(manifest),
-                        "chapters_with_audio": sum(1 for v in manifest.values() if v is not None),
-                        "chapters_pending": sum(1 for v in manifest.values() if v is None),
+                        "chapters_with_audio": len(manifest) - pending,
+                        "chapters_pending": pending,
                     }
             except json.JSONDecodeError as e:
                 self.test("Manifest is valid JSON", False, str(e))
@@ -338,12 +722,16 @@ class AudioDiagnosticRunner:
         self.checkpoint("Audio Files", notes=["Validate all audio files"])
 
         if self.audio_dir.exists():
-            audio_files = list(self.audio_dir.glob("*.mp3"))
+            entries = self.audio_entries()
+            audio_files = [Path(entry.path) for entry in entries]
             self.test("Audio files present", len(audio_files) > 0, f"{len(audio_files)} files")
 
-            for audio_file in sorted(audio_files):
-                validation = self.validate_mp3(audio_file)
+            # Header reads and ffprobe fallbacks are I/O bound, so validate
+            # concurrently; results come back in order for stable reporting
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                validations = list(pool.map(self._validate_entry, entries))
 
+            for audio_file, validation in zip(audio_files, validations):
                 if validation["is_valid"]:
                     self.session.audio_files_validated += 1
                     duration = validation["duration_sec"]
@@ -370,7 +758,7 @@ class AudioDiagnosticRunner:
         self.checkpoint("Manifest-Audio Alignment", notes=["Cross-reference manifest with actual files"])
 
         if manifest and self.audio_dir.exists():
-            audio_files = {f.name for f in self.audio_dir.glob("*.mp3")}
+            audio_files = self.audio_names()
 
             for chapter_slug, chapter_data in manifest.items():
                 if chapter_data is None:
@@ -411,29 +799,15 @@ class AudioDiagnosticRunner:
         if read_dir.exists():
             chapter_files = sorted(read_dir.glob("chapter-*.html"))
 
-            for chapter_file in chapter_files:
-                content = chapter_file.read_text()
-
-                has_player_css = "/css/chapter-player.css" in content
-                has_player_js = "/js/chapter-player.js" in content
-                has_error_tracker = "/js/error-tracker.js" in content
-                has_favicon = "/favicon.svg" in content
-
-                all_integrated = has_player_css and has_player_js and has_error_tracker and has_favicon
-
-                missing = []
-                if not has_player_css:
-                    missing.append("CSS")
-                if not has_player_js:
-                    missing.append("JS")
-                if not has_error_tracker:
-                    missing.append("error-tracker")
-                if not has_favicon:
-                    missing.append("favicon")
+            # Page scans are independent file I/O; run them concurrently and
+            # report in sorted order
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                results = list(pool.map(self._scan_chapter, chapter_files))
 
+            for name, missing in results:
                 self.test(
-                    chapter_file.name,
-                    all_integrated,
+                    name,
+                    not missing,
                     f"missing: {', '.join(missing)}" if missing else "fully integrated"
                 )
 
@@ -477,29 +851,76 @@ class AudioDiagnosticRunner:
 
         self.end_checkpoint()
 
+    def _report_lines(self, total_minutes: float) -> Iterator[str]:
+        """Yield the lines of the human-readable report."""
+        session = self.session
+
+        yield "# Audio Production Diagnostic Report"
+        yield ""
+        yield f"**Session ID:** {session.session_id}"
+        yield f"**Series:** {session.series}"
+        yield f"**Started:** {session.started_at}"
+        yield (
+            f"**Duration:** {session.total_duration_ms:.0f}ms"
+            if session.total_duration_ms else ""
+        )
+        yield ""
+        yield "## Summary"
+        yield ""
+        yield "| Metric | Value |"
+        yield "|--------|-------|"
+        yield f"| Tests Passed | {session.tests_passed} |"
+        yield f"| Tests Failed | {session.tests_failed} |"
+        yield f"| Audio Files Validated | {session.audio_files_validated} |"
+        yield f"| Total Audio Duration | {total_minutes:.1f} minutes |"
+        yield f"| Errors | {len(session.errors)} |"
+        yield f"| Warnings | {len(session.warnings)} |"
+        yield ""
+        yield "## Checkpoints"
+        yield ""
+
+        for cp in session.checkpoints:
+            status = "✓ PASS" if cp.passed else "✗ FAIL"
+            yield f"### {cp.name} [{status}]"
+            yield ""
+            yield f"- Tests: {cp.tests_in_checkpoint}, Failures: {cp.failures_in_checkpoint}"
+            for note in cp.notes:
+                yield f"- {note}"
+            if cp.files_checked:
+                yield f"- Files checked: {len(cp.files_checked)}"
+            if cp.manifest_state:
+                yield f"- Manifest: {cp.manifest_state}"
+            yield ""
+
+        if session.errors:
+            yield "## Errors"
+            yield ""
+            for err in session.errors:
+                yield f"- [{err.event_type}] {err.data.get('message', err.data)}"
+            yield ""
+
+        if session.warnings:
+            yield "## Warnings"
+            yield ""
+            for warn in session.warnings:
+                yield f"- {warn.data.get('message', warn.data)}"
+            yield ""
+
     def _generate_outputs(self):
         """Generate human and machine readable outputs."""
 
         # === TELEMETRY JSON ===
         telemetry_path = self.session_dir / "telemetry.json"
 
-        session_dict = {
-            "session_id": self.session.session_id,
-            "started_at": self.session.started_at,
-            "ended_at": self.session.ended_at,
-            "series": self.session.series,
-            "total_duration_ms": self.session.total_duration_ms,
-            "tests_passed": self.session.tests_passed,
-            "tests_failed": self.session.tests_failed,
-            "audio_files_validated": self.session.audio_files_validated,
-            "total_audio_duration_sec": self.session.total_audio_duration_sec,
-            "checkpoints": [asdict(c) for c in self.session.checkpoints],
-            "errors": [asdict(e) for e in self.session.errors],
-            "warnings": [asdict(w) for w in self.session.warnings],
-        }
+        session_dict = self.session.as_dict()
 
-        with open(telemetry_path, "w") as f:
-            json.dump(session_dict, f, indent=2, default=str)
+        if HAS_ORJSON:
+            telemetry_path.write_bytes(
+                orjson.dumps(session_dict, default=str, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with open(telemetry_path, "w") as f:
+                json.dump(session_dict, f, indent=2, default=str)
 
         print(f"\nTelemetry saved: {telemetry_path}")
 
@@ -508,59 +929,9 @@ class AudioDiagnosticRunner:
 
         total_minutes = self.session.total_audio_duration_sec / 60
 
-        report = [
-            f"# Audio Production Diagnostic Report",
-            f"",
-            f"**Session ID:** {self.session.session_id}",
-            f"**Series:** {self.session.series}",
-            f"**Started:** {self.session.started_at}",
-            f"**Duration:** {self.session.total_duration_ms:.0f}ms" if self.session.total_duration_ms else "",
-            f"",
-            f"## Summary",
-            f"",
-            f"| Metric | Value |",
-            f"|--------|-------|",
-            f"| Tests Passed | {self.session.tests_passed} |",
-            f"| Tests Failed | {self.session.tests_failed} |",
-            f"| Audio Files Validated | {self.session.audio_files_validated} |",
-            f"| Total Audio Duration | {total_minutes:.1f} minutes |",
-            f"| Errors | {len(self.session.errors)} |",
-            f"| Warnings | {len(self.session.warnings)} |",
-            f"",
-            f"## Checkpoints",
-            f"",
-        ]
-
-        for cp in self.session.checkpoints:
-            status = "✓ PASS" if cp.passed else "✗ FAIL"
-            report.append(f"### {cp.name} [{status}]")
-            report.append(f"")
-            report.append(f"- Tests: {cp.tests_in_checkpoint}, Failures: {cp.failures_in_checkpoint}")
-            if cp.notes:
-                for note in cp.notes:
-                    report.append(f"- {note}")
-            if cp.files_checked:
-                report.append(f"- Files checked: {len(cp.files_checked)}")
-            if cp.manifest_state:
-                report.append(f"- Manifest: {cp.manifest_state}")
-            report.append(f"")
-
-        if self.session.errors:
-            report.append(f"## Errors")
-            report.append(f"")
-            for err in self.session.errors:
-                report.append(f"- [{err.event_type}] {err.data.get('message', err.data)}")
-            report.append(f"")
-
-        if self.session.warnings:
-            report.append(f"## Warnings")
-            report.append(f"")
-            for warn in self.session.warnings:
-                report.append(f"- {warn.data.get('message', warn.data)}")
-            report.append(f"")
-
+        # Stream the report into the file line by line; no list or join
         with open(report_path, "w") as f:
-            f.write("\n".join(report))
+            f.writelines(line + "\n" for line in self._report_lines(total_minutes))
 
         print(f"Report saved: {report_path}")
 
@@ -12,6 +12,7 @@ Supported APIs:
 Usage:
     ./doc-to-audio.py --input docs/tools/coord-init.md --output audio/
     ./doc-to-audio.py --input docs/ --recursive --output audio/
+    ./doc-to-audio.py --input scene.md --output - | ffmpeg -f mp3 -i pipe:0 ...
 
 Features:
 - Markdown cleaning (removes code blocks, tables, etc.)
@@ -22,50 +23,160 @@ Features:
 """
 
 import argparse
+import contextlib
+import functools
+import hashlib
 import json
 import os
 import re
+import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Union
+from typing import TYPE_CHECKING, Any, Callable, Union
 
-try:
-    from rich.console import Console
+# Optional dependencies (install as needed) are only located here and
+# imported on first use: the TTS SDKs alone add hundreds of milliseconds to
+# start-up, which say-only runs never need
+HAS_RICH = find_spec("rich") is not None
+
+# TTS Provider imports
+HAS_ELEVENLABS = find_spec("elevenlabs") is not None
+HAS_OPENAI = find_spec("openai") is not None
 
-    HAS_RICH = True
-except ImportError:
-    HAS_RICH = False
+HAS_MUTAGEN = find_spec("mutagen") is not None
 
-# TTS Provider imports (optional - install as needed)
-try:
+if TYPE_CHECKING:
     from elevenlabs.client import ElevenLabs
+    from rich.console import Console
+    from simulacrum.audio.budget import AudioBudgetManager
 
-    HAS_ELEVENLABS = True
-except ImportError:
-    HAS_ELEVENLABS = False
 
-try:
-    from openai import OpenAI
+@functools.lru_cache(maxsize=None)
+def _rich_console() -> "Console | None":
+    """The shared rich Console, or None when rich is not installed"""
+    if not HAS_RICH:
+        return None
+    from rich.console import Console
 
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+    return Console()
+
+
+# Markdown cleaning patterns, compiled once at import
+_FRONTMATTER_RE = re.compile(r"^---\n.*?\n---\n", re.DOTALL)
+_HEADER_RE = re.compile(r"^(#{1,6}) (.+)$", re.MULTILINE)
+# Narrative mode drops the title, scene metadata lines and rules entirely
+_NARRATIVE_STRIP_RE = re.compile(
+    r"^(?:# .+"
+    r"|\*\*(?:Characters|Setting|Tone|Scene Type|Dramatic Function|Tension):\*\*.+"
+    r"|---+)$\n?",
+    re.MULTILINE,
+)
+_CODE_BLOCK_RE = re.compile(r"```([\w]*)\n(.*?)\n```", re.DOTALL)
+_TABLE_RE = re.compile(r"(\|.+\|\n)+", re.MULTILINE)
+_TABLE_SEPARATOR_RE = re.compile(r"^\|[\s\-:]+\|$")
+_BLOCKQUOTE_RE = re.compile(r"(?:^> .+\n?)+", re.MULTILINE)
+_BOLD_STAR_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_STAR_RE = re.compile(r"\*(.+?)\*")
+_BOLD_UNDERSCORE_RE = re.compile(r"__(.+?)__")
+_ITALIC_UNDERSCORE_RE = re.compile(r"_(.+?)_")
+_LINK_RE = re.compile(r"\[(.+?)\]\(.+?\)")
+_IMAGE_RE = re.compile(r"!\[(.+?)\]\(.+?\)")
+_INLINE_CODE_RE = re.compile(r"`(.+?)`")
+# Line-start markup, in the order it used to be stripped: list marker,
+# numbered marker, blockquote marker, then a horizontal rule (whole line)
+_LINE_MARKUP_RE = re.compile(
+    r"^(?:[\-\*\+] )?(?:\d+\. )?(?:> )?(?:[\-\*_]{3,}$)?", re.MULTILINE
+)
+_SECTION_PAUSE_RE = re.compile(r"\.(Section:|Subsection:|Topic:)")
+_SENTENCE_SPLIT_RE = re.compile(r"([.!?]\s+)")
+
+# Voice tags with optional tone attribute:
+# <VOICE:TYPE> or <VOICE:TYPE tone="emotion">
+_VOICE_SEGMENT_RE = re.compile(
+    r'<VOICE:(\w+)(?:\s+tone="([^"]*)")?>(.*?)</VOICE:\1>', re.DOTALL
+)
+
+# Tone marker prepended to multi-voice segments: "[TONE:nervous] text"
+_TONE_MARKER_RE = re.compile(r"\[TONE:(\w+)\]\s*(.+)", re.DOTALL)
+
+# Write buffer for downloaded audio: network chunks are small, so batch
+# them into ~1 MB writes instead of one syscall each
+_AUDIO_WRITE_BUFFER = 1024 * 1024
+
+# Concurrent chunk renders per file by default: HTTP providers are bound by
+# ElevenLabs/OpenAI concurrency limits, say runs by the local cores
+_DEFAULT_JOBS = 4
+
+# Thread cap for ffmpeg encodes: chunks already render in parallel, so
+# letting every ffmpeg spawn a thread per core only oversubscribes
+_FFMPEG_THREADS = str(max(1, (os.cpu_count() or 1) // _DEFAULT_JOBS))
+
+# Every mp3 this script encodes uses one format (44.1 kHz stereo, 192k), so
+# stitched and mixed audio never needs a hidden resample or second transcode
+_MP3_ENCODE_ARGS = ["-c:a", "libmp3lame", "-b:a", "192k", "-ar", "44100", "-ac", "2"]
+# Intermediates (multi-voice segments, pre-mix audio) stay lossless PCM so
+# the final mp3 is the only lossy encode
+_WAV_ENCODE_ARGS = ["-c:a", "pcm_s16le", "-ar", "44100", "-ac", "2"]
+
+
+def _encode_args(output_path: str | Path) -> list[str]:
+    """ffmpeg codec arguments for the format implied by output_path"""
+    if str(output_path).endswith(".wav"):
+        return _WAV_ENCODE_ARGS
+    return _MP3_ENCODE_ARGS
+
+
+def _encode_audio(input_path: str | Path, output_path: str | Path) -> None:
+    """Re-encode input_path to output_path's format"""
+    subprocess.run(
+        ["ffmpeg", "-i", str(input_path), *_encode_args(output_path), str(output_path), "-y"],
+        check=True,
+        capture_output=True,
+    )
 
-try:
-    from mutagen.id3 import ID3, TALB, TIT2, TPE1, USLT
-    from mutagen.mp3 import MP3
 
-    HAS_MUTAGEN = True
-except ImportError:
-    HAS_MUTAGEN = False
+# Free space /dev/shm needs before segment scratch goes there (containers
+# often mount only 64 MB, less than one chunk of WAV segments)
+_SHM_MIN_FREE = 1024**3
+
+
+@functools.lru_cache(maxsize=None)
+def _scratch_dir() -> str | None:
+    """Where transient segment audio is written
+
+    $SIMULACRUM_TMPDIR if set, else RAM-backed /dev/shm when it has room,
+    else None (tempfile's default, i.e. $TMPDIR).
+    """
+    scratch = os.environ.get("SIMULACRUM_TMPDIR")
+    if scratch:
+        return scratch
+    try:
+        if shutil.disk_usage("/dev/shm").free >= _SHM_MIN_FREE:
+            return "/dev/shm"
+    except OSError:
+        pass
+    return None
 
 
 class MarkdownCleaner:
-    """Clean markdown for TTS conversion"""
+    """Clean markdown for TTS conversion
+
+    Patterns are module-level and the console is shared, so the only
+    per-instance state is the two mode flags: one cleaner can be reused
+    for every file in a run, including from several threads.
+    """
+
+    # Spoken prefix per header level (H4+ is just the title)
+    HEADER_PREFIXES = {1: "Section: ", 2: "Subsection: ", 3: "Topic: "}
 
     def __init__(self, multi_voice: bool = False, narrative: bool = False):
-        self.console = Console() if HAS_RICH else None
+        self.console = _rich_console()
         self.multi_voice = multi_voice
         self.narrative = narrative
 
@@ -73,7 +184,8 @@ class MarkdownCleaner:
         """Clean markdown text for speech"""
 
         # Remove YAML frontmatter
-        markdown = re.sub(r"^---\n.*?\n---\n", "", markdown, flags=re.DOTALL)
+        if markdown.startswith("---\n"):
+            markdown = _FRONTMATTER_RE.sub("", markdown)
 
         # Convert headers to natural speech
         markdown = self._convert_headers(markdown)
@@ -99,7 +211,8 @@ class MarkdownCleaner:
         """Clean markdown and add voice tags for multi-voice narration"""
 
         # Remove YAML frontmatter
-        markdown = re.sub(r"^---\n.*?\n---\n", "", markdown, flags=re.DOTALL)
+        if markdown.startswith("---\n"):
+            markdown = _FRONTMATTER_RE.sub("", markdown)
 
         # Tag code blocks BEFORE cleaning
         markdown = self._tag_code_blocks(markdown)
@@ -117,8 +230,21 @@ class MarkdownCleaner:
 
         return markdown
 
+    @staticmethod
+    def _has_code_fence(text: str) -> bool:
+        """Whether an opening ``` is followed by a closing one
+
+        The code block pattern's lazy DOTALL body rescans to the end of the
+        document for every unterminated fence, so skip it outright when no
+        closing fence can exist.
+        """
+        start = text.find("```")
+        return start != -1 and text.find("\n```", start + 3) != -1
+
     def _tag_code_blocks(self, text: str) -> str:
         """Tag code blocks for voice switching - Hybrid approach (Options 2+4)"""
+        if not self._has_code_fence(text):
+            return text
 
         def replace_code(match):
             lang = match.group(1) or "code"
@@ -142,7 +268,7 @@ class MarkdownCleaner:
 
             return f"<VOICE:CODE>{description} Full implementation available in written documentation.</VOICE:CODE>"
 
-        return re.sub(r"```([\w]*)\n(.*?)\n```", replace_code, text, flags=re.DOTALL)
+        return _CODE_BLOCK_RE.sub(replace_code, text)
 
     def _describe_code(self, first_line: str, lang: str, line_count: int) -> str:
         """Generate smart description for code blocks (Option 4 - AI-assisted)"""
@@ -179,15 +305,17 @@ class MarkdownCleaner:
 
     def _tag_blockquotes(self, text: str) -> str:
         """Tag blockquotes for voice switching"""
+        if not text.startswith("> ") and "\n> " not in text:
+            return text
 
         # Find blockquote sections
         def replace_quote(match):
-            content = match.group(0)
-            # Remove > markers
-            content = re.sub(r"^> ", "", content, flags=re.MULTILINE)
+            # Remove > markers: every line of the match starts with "> ",
+            # so drop the first and the one after each newline
+            content = match.group(0)[2:].replace("\n> ", "\n")
             return f"<VOICE:QUOTE>{content}</VOICE:QUOTE>"
 
-        return re.sub(r"(^> .+$\n?)+", replace_quote, text, flags=re.MULTILINE)
+        return _BLOCKQUOTE_RE.sub(replace_quote, text)
 
     def _tag_headers(self, text: str) -> str:
         """Tag headers for voice switching"""
@@ -195,93 +323,40 @@ class MarkdownCleaner:
             # Narrative mode: strip headers entirely (handled in _convert_headers)
             return text
 
-        # H1: "Section: Title"
-        text = re.sub(
-            r"^# (.+)$",
-            r"<VOICE:HEADER>Section: \1.</VOICE:HEADER>",
-            text,
-            flags=re.MULTILINE,
-        )
-
-        # H2: "Subsection: Title"
-        text = re.sub(
-            r"^## (.+)$",
-            r"<VOICE:HEADER>Subsection: \1.</VOICE:HEADER>",
-            text,
-            flags=re.MULTILINE,
-        )
+        if "# " not in text:
+            return text
 
-        # H3: "Topic: Title"
-        text = re.sub(
-            r"^### (.+)$",
-            r"<VOICE:HEADER>Topic: \1.</VOICE:HEADER>",
+        # Same wording as _convert_headers, wrapped for the header voice
+        return _HEADER_RE.sub(
+            lambda match: f"<VOICE:HEADER>{self._speak_header(match)}</VOICE:HEADER>",
             text,
-            flags=re.MULTILINE,
         )
 
-        # H4+: Just the title with header voice
-        text = re.sub(
-            r"^#### (.+)$",
-            r"<VOICE:HEADER>\1.</VOICE:HEADER>",
-            text,
-            flags=re.MULTILINE,
-        )
-        text = re.sub(
-            r"^##### (.+)$",
-            r"<VOICE:HEADER>\1.</VOICE:HEADER>",
-            text,
-            flags=re.MULTILINE,
-        )
-        text = re.sub(
-            r"^###### (.+)$",
-            r"<VOICE:HEADER>\1.</VOICE:HEADER>",
-            text,
-            flags=re.MULTILINE,
-        )
-
-        return text
-
     def _convert_headers(self, text: str) -> str:
         """Convert markdown headers to natural speech"""
 
         if self.narrative:
             # Narrative mode: strip headers and metadata lines entirely
-            text = re.sub(r"^# .+$\n?", "", text, flags=re.MULTILINE)
-            text = re.sub(r"^\*\*Characters:\*\*.+$\n?", "", text, flags=re.MULTILINE)
-            text = re.sub(r"^\*\*Setting:\*\*.+$\n?", "", text, flags=re.MULTILINE)
-            text = re.sub(r"^\*\*Tone:\*\*.+$\n?", "", text, flags=re.MULTILINE)
-            text = re.sub(r"^---+$\n?", "", text, flags=re.MULTILINE)
-            # Also strip scene metadata at the end
-            text = re.sub(r"^\*\*Scene Type:\*\*.+$\n?", "", text, flags=re.MULTILINE)
-            text = re.sub(
-                r"^\*\*Dramatic Function:\*\*.+$\n?", "", text, flags=re.MULTILINE
-            )
-            text = re.sub(r"^\*\*Tension:\*\*.+$\n?", "", text, flags=re.MULTILINE)
-            return text
-
-        # H1: "Section: Title"
-        text = re.sub(r"^# (.+)$", r"Section: \1.", text, flags=re.MULTILINE)
-
-        # H2: "Subsection: Title"
-        text = re.sub(r"^## (.+)$", r"Subsection: \1.", text, flags=re.MULTILINE)
+            # (including the scene metadata at the end) in one pass
+            return _NARRATIVE_STRIP_RE.sub("", text)
 
-        # H3: "Topic: Title"
-        text = re.sub(r"^### (.+)$", r"Topic: \1.", text, flags=re.MULTILINE)
+        if "# " not in text:
+            return text
 
-        # H4+: Just the title
-        text = re.sub(r"^#### (.+)$", r"\1.", text, flags=re.MULTILINE)
-        text = re.sub(r"^##### (.+)$", r"\1.", text, flags=re.MULTILINE)
-        text = re.sub(r"^###### (.+)$", r"\1.", text, flags=re.MULTILINE)
+        return _HEADER_RE.sub(self._speak_header, text)
 
-        return text
+    def _speak_header(self, match: Any) -> str:
+        """Spoken form of a header, e.g. "Section: Title." for H1"""
+        prefix = self.HEADER_PREFIXES.get(len(match.group(1)), "")
+        return f"{prefix}{match.group(2)}."
 
     def _handle_code_blocks(self, text: str) -> str:
         """Handle code blocks - describe or remove"""
+        if not self._has_code_fence(text):
+            return text
 
         # Option 1: Remove entirely (simplest)
-        text = re.sub(
-            r"```[\w]*\n.*?\n```", "[Code example omitted]", text, flags=re.DOTALL
-        )
+        text = _CODE_BLOCK_RE.sub("[Code example omitted]", text)
 
         # Option 2: Describe (more informative)
         # def replace_code(match):
@@ -293,63 +368,72 @@ class MarkdownCleaner:
 
     def _handle_tables(self, text: str) -> str:
         """Handle markdown tables - describe or remove"""
+        # Every table row ends in "|\n"
+        if "|\n" not in text:
+            return text
 
         # Detect tables (look for | separators)
         def replace_table(match: Any) -> str:
             lines = match.group(0).strip().split("\n")
             # Count rows (minus separator line)
             rows = len(
-                [line for line in lines if not re.match(r"^\|[\s\-:]+\|$", line)]
+                [line for line in lines if not _TABLE_SEPARATOR_RE.match(line)]
             )
             return f"[Table with {rows} rows]"
 
-        text = re.sub(r"(\|.+\|\n)+", replace_table, text, flags=re.MULTILINE)
+        text = _TABLE_RE.sub(replace_table, text)
 
         return text
 
     def _clean_markdown_syntax(self, text: str) -> str:
         """Remove markdown syntax"""
 
+        # Each pass is skipped when a substring check (a C-level scan) shows
+        # its marker character cannot occur, so plain prose never reaches
+        # the regex engine
+
         # Bold/italic
-        text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)  # **bold**
-        text = re.sub(r"\*(.+?)\*", r"\1", text)  # *italic*
-        text = re.sub(r"__(.+?)__", r"\1", text)  # __bold__
-        text = re.sub(r"_(.+?)_", r"\1", text)  # _italic_
+        if "*" in text:
+            text = _BOLD_STAR_RE.sub(r"\1", text)  # **bold**
+            text = _ITALIC_STAR_RE.sub(r"\1", text)  # *italic*
+        if "_" in text:
+            text = _BOLD_UNDERSCORE_RE.sub(r"\1", text)  # __bold__
+            text = _ITALIC_UNDERSCORE_RE.sub(r"\1", text)  # _italic_
 
-        # Links: [text](url) → text
-        text = re.sub(r"\[(.+?)\]\(.+?\)", r"\1", text)
+        if "](" in text:
+            # Links: [text](url) → text
+            text = _LINK_RE.sub(r"\1", text)
 
-        # Images: ![alt](url) → [Image: alt]
-        text = re.sub(r"!\[(.+?)\]\(.+?\)", r"[Image: \1]", text)
+            # Images: ![alt](url) → [Image: alt]
+            text = _IMAGE_RE.sub(r"[Image: \1]", text)
 
         # Inline code: `code` → code
-        text = re.sub(r"`(.+?)`", r"\1", text)
-
-        # Lists: - item → item
-        text = re.sub(r"^[\-\*\+] ", "", text, flags=re.MULTILINE)
-
-        # Numbered lists: 1. item → item
-        text = re.sub(r"^\d+\. ", "", text, flags=re.MULTILINE)
-
-        # Blockquotes: > text → text
-        text = re.sub(r"^> ", "", text, flags=re.MULTILINE)
+        if "`" in text:
+            text = _INLINE_CODE_RE.sub(r"\1", text)
 
-        # Horizontal rules
-        text = re.sub(r"^[\-\*_]{3,}$", "", text, flags=re.MULTILINE)
+        # Lists (- item → item), numbered lists (1. item → item),
+        # blockquotes (> text → text) and horizontal rules, in one pass
+        text = _LINE_MARKUP_RE.sub("", text)
 
         return text
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace"""
 
+        # Remove multiple blank lines and multiple spaces with repeated
+        # str.replace: each C-level pass shortens every run, so typical text
+        # needs only one or two passes and never enters the regex engine
+
         # Remove multiple blank lines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        while "\n\n\n" in text:
+            text = text.replace("\n\n\n", "\n\n")
 
         # Remove leading/trailing whitespace on lines
-        text = "\n".join(line.strip() for line in text.split("\n"))
+        text = "\n".join([line.strip() for line in text.split("\n")])
 
         # Remove multiple spaces
-        text = re.sub(r" {2,}", " ", text)
+        while "  " in text:
+            text = text.replace("  ", " ")
 
         return text.strip()
 
@@ -357,7 +441,7 @@ class MarkdownCleaner:
         """Add natural pauses for better speech flow"""
 
         # Longer pause after sections
-        text = re.sub(r"\.(Section:|Subsection:|Topic:)", r".\n\n\1", text)
+        text = _SECTION_PAUSE_RE.sub(r".\n\n\1", text)
 
         # Pause after paragraphs (double newline)
         # (Already handled by markdown structure)
@@ -381,25 +465,28 @@ class ChunkManager:
 
         if preserve_sentences:
             # Split on sentence boundaries
-            sentences = re.split(r"([.!?]\s+)", text)
-            current_chunk = ""
+            sentences = _SENTENCE_SPLIT_RE.split(text)
+            # Accumulate pieces in a list and join once per chunk; repeated
+            # string += can copy the growing chunk on every sentence
+            current_parts: list[str] = []
+            current_len = 0
 
             for i in range(0, len(sentences), 2):
                 sentence = sentences[i]
                 delimiter = sentences[i + 1] if i + 1 < len(sentences) else ""
+                piece_len = len(sentence) + len(delimiter)
 
-                if (
-                    len(current_chunk) + len(sentence) + len(delimiter)
-                    <= self.max_chunk_size
-                ):
-                    current_chunk += sentence + delimiter
+                if current_len + piece_len <= self.max_chunk_size:
+                    current_parts += (sentence, delimiter)
+                    current_len += piece_len
                 else:
-                    if current_chunk:
-                        chunks.append(current_chunk.strip())
-                    current_chunk = sentence + delimiter
+                    if current_len:
+                        chunks.append("".join(current_parts).strip())
+                    current_parts = [sentence, delimiter]
+                    current_len = piece_len
 
-            if current_chunk:
-                chunks.append(current_chunk.strip())
+            if current_len:
+                chunks.append("".join(current_parts).strip())
         else:
             # Simple split at max_chunk_size
             chunks = [
@@ -410,6 +497,172 @@ class ChunkManager:
         return chunks
 
 
+class TTSCache:
+    """Content-addressed on-disk cache for cleaned text and generated audio
+
+    Keys are a SHA-256 over everything that determines the output, so an
+    edited document or a different voice simply misses. Hits skip the
+    cleaning pass or the TTS call (and its API cost) entirely. Entries are
+    touched on use, and curate() evicts the least recently used ones once
+    the cache outgrows ``max_bytes``.
+    """
+
+    DEFAULT_MAX_BYTES = 2 * 1024**3
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if root is None:
+            cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+            root = Path(cache_home) / "simulacrum-stories"
+        self.root = root
+        self.audio_dir = root / "tts"
+        self.cleaned_dir = root / "cleaned"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Cleaned text depends on this script's cleaning rules as well as
+        # the document, so edits to the script invalidate it
+        self._script_digest = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+    @staticmethod
+    def key(*parts: str) -> str:
+        """Cache key for the given output-determining parts"""
+        return hashlib.sha256("\x1f".join(parts).encode()).hexdigest()
+
+    def get(self, key: str, suffix: str = ".mp3") -> Path | None:
+        """Cached audio for key in the given format, if any"""
+        path = self.audio_dir / f"{key}{suffix}"
+        try:
+            # Mark as recently used for curate()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key: str, audio_path: str | Path) -> None:
+        """Store generated audio under key (best effort)"""
+        path = self.audio_dir / f"{key}{Path(audio_path).suffix}"
+        with open(audio_path, "rb") as src:
+            self._store(path, lambda f: shutil.copyfileobj(src, f))
+
+    def restore(self, key: str, output_path: str) -> bool:
+        """Copy cached audio for key to output_path; False on a miss"""
+        cached = self.get(key, Path(output_path).suffix)
+        if cached is None:
+            return False
+        try:
+            shutil.copyfile(cached, output_path)
+        except FileNotFoundError:
+            # Evicted by another run's curate() in the meantime
+            return False
+        return True
+
+    def cleaned_for(self, body: str, options: str, clean: Callable[[str], str]) -> str:
+        """Cleaned text for a markdown body, cleaning only on a miss"""
+        path = self.cleaned_dir / f"{self.key(self._script_digest, options, body)}.txt"
+        try:
+            cleaned = path.read_text(encoding="utf-8")
+            os.utime(path)
+            return cleaned
+        except OSError:
+            pass
+        cleaned = clean(body)
+        self._store(path, lambda f: f.write(cleaned.encode("utf-8")))
+        return cleaned
+
+    def curate(self) -> None:
+        """Evict least recently used entries while over the size budget
+
+        Trims to 90% of max_bytes so the next few runs have headroom before
+        another eviction pass is needed.
+        """
+        entries = []
+        for directory in (self.audio_dir, self.cleaned_dir):
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.name.endswith(".tmp"):
+                            continue
+                        with contextlib.suppress(OSError):
+                            st = entry.stat()
+                            entries.append((st.st_mtime, st.st_size, entry.path))
+            except FileNotFoundError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+
+        target = self.max_bytes * 0.9
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            with contextlib.suppress(OSError):
+                os.unlink(path)
+            total -= size
+
+    def summary(self) -> str:
+        """Audio hit rate for this run"""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups if lookups else 0.0
+        return f"{self.hits}/{lookups} audio cache hits ({rate:.0%})"
+
+    @staticmethod
+    def _store(path: Path, write: Callable[[Any], Any]) -> None:
+        # Write beside the target and rename so readers never see a partial
+        # entry; a cache that cannot be written is just a cache miss later
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _elevenlabs_client(api_key: str) -> "ElevenLabs":
+    """Shared client per API key
+
+    The client owns an HTTP connection pool, so sharing it lets every
+    chunk and segment reuse open TLS connections instead of paying a new
+    handshake per request.
+    """
+    from elevenlabs.client import ElevenLabs
+
+    return ElevenLabs(api_key=api_key)
+
+
+_BUDGET_LOCK = threading.Lock()
+
+# ElevenLabs rejects requests beyond a per-account concurrency limit; files,
+# chunks and segments all run in parallel, so one process-wide cap bounds
+# the in-flight requests across every level
+_ELEVENLABS_MAX_CONCURRENT = 8
+_ELEVENLABS_SLOTS = threading.BoundedSemaphore(_ELEVENLABS_MAX_CONCURRENT)
+
+
+@functools.lru_cache(maxsize=None)
+def _budget_manager() -> "AudioBudgetManager":
+    """Audio budget manager shared by every request in this run
+
+    Imported in-process rather than run as a subprocess per chunk, which
+    paid for a fresh interpreter start each time.
+    """
+    src_dir = str(Path(__file__).resolve().parent.parent / "src")
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
+    from simulacrum.audio.budget import AudioBudgetManager
+
+    return AudioBudgetManager()
+
+
 class ElevenLabsTTS:
     """11 Labs TTS provider with V3 audio tag support"""
 
@@ -439,20 +692,26 @@ class ElevenLabsTTS:
         "calm": "[calmly]",
     }
 
-    def __init__(self, api_key: str, voice: str = "Adam", use_v3: bool = True):
+    def __init__(
+        self,
+        api_key: str,
+        voice: str = "Adam",
+        use_v3: bool = True,
+        cache: TTSCache | None = None,
+    ):
         if not HAS_ELEVENLABS:
             raise ImportError(
                 "elevenlabs package not installed: pip install elevenlabs"
             )
 
-        self.client = ElevenLabs(api_key=api_key)
+        self.client = _elevenlabs_client(api_key)
         self.voice = voice
         self.use_v3 = use_v3
         self.model_id = "eleven_v3" if use_v3 else "eleven_multilingual_v2"
+        self.cache = cache
 
     def _convert_tone_to_audio_tags(self, text: str) -> str:
         """Convert tone="..." attributes to V3 audio tags"""
-        import re
 
         # Find tone patterns like: some text with tone="nervous"
         # These come from voice tags parsed earlier
@@ -460,7 +719,10 @@ class ElevenLabsTTS:
 
         # Check if text starts with a tone indicator (from previous parsing)
         # Format: [TONE:nervous] text
-        tone_match = re.match(r"\[TONE:(\w+)\]\s*(.+)", text, re.DOTALL)
+        if not text.startswith("[TONE:"):
+            return text
+
+        tone_match = _TONE_MARKER_RE.match(text)
         if tone_match:
             tone = tone_match.group(1).lower()
             content = tone_match.group(2)
@@ -476,70 +738,98 @@ class ElevenLabsTTS:
         if self.use_v3:
             text = self._convert_tone_to_audio_tags(text)
 
+        # Reuse earlier audio for identical text (no API call, no budget use)
+        if self.cache is not None:
+            cache_key = self.cache.key("elevenlabs", self.voice, self.model_id, text)
+            if self.cache.restore(cache_key, output_path):
+                return
+
         # Track usage with budget manager (using elevenlabs_v3_alpha provider name)
         char_count = len(text)
         try:
-            import subprocess
-            import sys
-
-            script_dir = Path(__file__).parent
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    str(script_dir / "audio_budget_manager.py"),
-                    "request",
+            # In-process; the lock serializes this run's threads on the
+            # shared manager, request() itself locks out other processes
+            with _BUDGET_LOCK:
+                approved, reason = _budget_manager().request(
                     "elevenlabs_v3_alpha",  # Budget manager uses this provider name
-                    str(char_count),
-                ],
-                capture_output=True,
-                text=True,
-                check=False,  # Don't raise on budget exceeded
-            )
-            if result.returncode != 0:
-                print(f"⚠️  Budget warning: {result.stderr or result.stdout}")
+                    char_count,
+                )
+            if not approved:  # Don't raise on budget exceeded
+                print(f"⚠️  Budget warning: {reason}")
         except Exception as e:
             print(f"⚠️  Budget tracking failed: {e}")
 
-        # Generate audio using new client API
-        audio = self.client.text_to_speech.convert(
-            text=text, voice_id=self.voice, model_id=self.model_id
-        )
+        # The response streams while it is written, so hold the slot until
+        # the whole body has arrived
+        with _ELEVENLABS_SLOTS:
+            # Generate audio using new client API
+            audio = self.client.text_to_speech.convert(
+                text=text, voice_id=self.voice, model_id=self.model_id
+            )
 
-        # Save to file
-        with open(output_path, "wb") as f:
-            for chunk in audio:
-                f.write(chunk)
+            # Save to file
+            with open(output_path, "wb", buffering=_AUDIO_WRITE_BUFFER) as f:
+                for chunk in audio:
+                    f.write(chunk)
+
+        if self.cache is not None:
+            self.cache.put(cache_key, output_path)
 
 
 class OpenAITTS:
     """OpenAI TTS provider"""
 
-    def __init__(self, api_key: str, voice: str = "alloy", model: str = "tts-1-hd"):
+    def __init__(
+        self,
+        api_key: str,
+        voice: str = "alloy",
+        model: str = "tts-1-hd",
+        cache: TTSCache | None = None,
+    ):
         if not HAS_OPENAI:
             raise ImportError("openai package not installed: pip install openai")
 
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=api_key)
         self.voice = voice
         self.model = model
+        self.cache = cache
 
     def generate(self, text: str, output_path: str) -> None:
         """Generate audio from text"""
 
+        if self.cache is not None:
+            cache_key = self.cache.key("openai", self.voice, self.model, text)
+            if self.cache.restore(cache_key, output_path):
+                return
+
         response = self.client.audio.speech.create(
             model=self.model, voice=self.voice, input=text
         )
 
-        response.stream_to_file(output_path)
+        with open(output_path, "wb", buffering=_AUDIO_WRITE_BUFFER) as f:
+            for chunk in response.iter_bytes(chunk_size=65536):
+                f.write(chunk)
+
+        if self.cache is not None:
+            self.cache.put(cache_key, output_path)
 
 
 class MacOSTTS:
     """macOS native TTS provider using 'say' command"""
 
-    def __init__(self, voice: str = "Daniel"):
+    def __init__(self, voice: str = "Daniel", cache: TTSCache | None = None):
         self.voice = voice
+        self.cache = cache
 
     def generate(self, text: str, output_path: str) -> None:
         """Generate audio from text using macOS say command"""
+        if self.cache is not None:
+            cache_key = self.cache.key("macos", self.voice, text)
+            if self.cache.restore(cache_key, output_path):
+                return
+
         # Generate AIFF file first (say command output format)
         aiff_path = str(Path(output_path).with_suffix(".aiff"))
 
@@ -552,29 +842,18 @@ class MacOSTTS:
                 text=True,
             )
 
-            # Convert AIFF to MP3 using ffmpeg
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-i",
-                    aiff_path,
-                    "-acodec",
-                    "libmp3lame",
-                    "-b:a",
-                    "192k",
-                    output_path,
-                    "-y",  # Overwrite output file
-                ],
-                check=True,
-                capture_output=True,
-                text=True,
-            )
+            # Convert AIFF to the output's format using ffmpeg: the episode
+            # mp3, or a WAV intermediate for multi-voice segments
+            _encode_audio(aiff_path, output_path)
 
         finally:
             # Clean up temporary AIFF file
             if Path(aiff_path).exists():
                 Path(aiff_path).unlink()
 
+        if self.cache is not None:
+            self.cache.put(cache_key, output_path)
+
 
 class VoiceMapper:
     """Maps content types to voices for multi-voice narration"""
@@ -730,9 +1009,45 @@ class VoiceMapper:
         self.voice_map[content_type] = char_voices[0]
 
 
+@functools.lru_cache(maxsize=4096)
+def _probe_duration(path: str, mtime_ns: int) -> float:
+    """Duration of an audio file in seconds, via ffprobe
+
+    Memoized on the path and the file's mtime, so repeated lookups skip the
+    subprocess while a rewritten file is probed again.
+    """
+    result = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            path,
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip())
+
+
+def _wav_duration(path: str | Path) -> float | None:
+    """Duration of a PCM WAV file from its header, or None if unreadable"""
+    try:
+        with wave.open(str(path), "rb") as w:
+            return w.getnframes() / w.getframerate()
+    except (OSError, EOFError, wave.Error):
+        return None
+
+
 class AudioMixer:
     """Advanced audio mixing with crossfading and normalization (Option C)"""
 
+    LOUDNORM_FILTER = "loudnorm=I=-16:TP=-1.5:LRA=11"
+
     def __init__(
         self,
         crossfade_duration: float = 0.5,
@@ -759,9 +1074,8 @@ class AudioMixer:
                 "-i",
                 input_path,
                 "-af",
-                "loudnorm=I=-16:TP=-1.5:LRA=11",
-                "-ar",
-                "44100",
+                self.LOUDNORM_FILTER,
+                *_encode_args(output_path),
                 output_path,
                 "-y",
             ],
@@ -780,26 +1094,29 @@ class AudioMixer:
         - Apply delays to position segments correctly in time
         - Use acrossfade to blend overlapping regions
         - Ensure final duration = sum(segments) - (N-1)*crossfade_duration
+        - Normalize each segment within the same filter graph when enabled
         """
         if len(segments) == 1:
-            # Single segment - just copy (with normalization if enabled)
+            # Single segment - just encode (with normalization if enabled);
+            # never copied, as provider mp3 isn't in the episode format
             if self.normalize:
                 self.normalize_audio(str(segments[0]), output_path)
             else:
-                import shutil
-
-                shutil.copy(segments[0], output_path)
+                _encode_audio(segments[0], output_path)
             return
 
-        # Normalize all segments first if requested
-        normalized_segments = []
+        # Normalize each input inside the same filter graph (loudnorm, then
+        # back to 44.1 kHz as normalize_audio does) so the whole mix is one
+        # ffmpeg process with no intermediate files
         if self.normalize:
-            for i, segment in enumerate(segments):
-                norm_path = segment.parent / f"norm_{segment.name}"
-                self.normalize_audio(str(segment), str(norm_path))
-                normalized_segments.append(norm_path)
+            filter_parts = [
+                f"[{i}]{self.LOUDNORM_FILTER},aresample=44100[n{i}]"
+                for i in range(len(segments))
+            ]
+            labels = [f"n{i}" for i in range(len(segments))]
         else:
-            normalized_segments = segments
+            filter_parts = []
+            labels = [str(i) for i in range(len(segments))]
 
         # Build complex ffmpeg filter for crossfading
         # Strategy: Chain acrossfade filters sequentially
@@ -807,40 +1124,40 @@ class AudioMixer:
         # This is NOT a bug - during crossfade, both audio streams are audible (fading)
         # Total duration = sum(segments) - (N-1)*crossfade_duration
 
-        inputs = " ".join([f"-i {seg}" for seg in normalized_segments])
-
-        # Build filter chain
-        filter_parts = []
-        for i in range(len(normalized_segments) - 1):
-            if i == 0:
-                # First crossfade: [0][1]acrossfade
-                filter_parts.append(
-                    f"[0][1]acrossfade=d={self.crossfade_duration}:c1=tri:c2=tri[a{i}]"
-                )
-            else:
-                # Subsequent crossfades: [a{i-1}][{i+1}]acrossfade
-                filter_parts.append(
-                    f"[a{i - 1}][{i + 1}]acrossfade=d={self.crossfade_duration}:c1=tri:c2=tri[a{i}]"
-                )
+        # Build filter chain: each crossfade joins the running mix (at first
+        # just the first input) with the next input, labelled [a0], [a1], ...
+        last_label = labels[0]
+        for i, label in enumerate(labels[1:]):
+            filter_parts.append(
+                f"[{last_label}][{label}]acrossfade=d={self.crossfade_duration}:c1=tri:c2=tri[a{i}]"
+            )
+            last_label = f"a{i}"
 
         filter_complex = ";".join(filter_parts)
-        last_label = (
-            f"a{len(normalized_segments) - 2}" if len(normalized_segments) > 2 else "a0"
-        )
-
-        # Execute ffmpeg with filter complex
-        cmd = f'ffmpeg {inputs} -filter_complex "{filter_complex}" -map "[{last_label}]" {output_path} -y'
 
-        subprocess.run(cmd, shell=True, check=True, capture_output=True)
-
-        # Cleanup normalized temp files
-        if self.normalize:
-            for norm_seg in normalized_segments:
-                if norm_seg.exists():
-                    norm_seg.unlink()
+        # Execute ffmpeg with filter complex (argv, no shell: paths may
+        # contain spaces or quotes)
+        cmd = ["ffmpeg"]
+        for seg in segments:
+            cmd += ["-i", str(seg)]
+        cmd += [
+            "-filter_complex",
+            filter_complex,
+            "-map",
+            f"[{last_label}]",
+            *_encode_args(output_path),
+            output_path,
+            "-y",
+        ]
+
+        subprocess.run(cmd, check=True, capture_output=True)
 
     def mix_with_background(
-        self, foreground: str, output_path: str, volume: float = 0.1
+        self,
+        foreground: str,
+        output_path: str,
+        volume: float = 0.1,
+        duration: float | None = None,
     ) -> None:
         """
         Mix foreground audio with background music
@@ -849,31 +1166,23 @@ class AudioMixer:
             foreground: Path to main audio (narration)
             output_path: Output path
             volume: Background music volume (0.0-1.0, default 0.1 = 10%)
+            duration: Foreground duration in seconds, if already known
+                (skips probing it with ffprobe)
         """
         if not self.background_music or not Path(self.background_music).exists():
-            # No background music - just copy
+            # No background music - just copy (or encode a WAV mix)
+            if Path(foreground).suffix != Path(output_path).suffix:
+                _encode_audio(foreground, output_path)
+                return
+
             import shutil
 
             shutil.copy(foreground, output_path)
             return
 
         # Get duration of foreground
-        duration_result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-show_entries",
-                "format=duration",
-                "-of",
-                "default=noprint_wrappers=1:nokey=1",
-                foreground,
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        duration = float(duration_result.stdout.strip())
+        if duration is None:
+            duration = _probe_duration(foreground, os.stat(foreground).st_mtime_ns)
 
         # Mix foreground with looped background music
         subprocess.run(
@@ -889,6 +1198,10 @@ class AudioMixer:
                 f"[1]volume={volume},aloop=loop=-1:size=2e9[bg];[0][bg]amix=inputs=2:duration=first",
                 "-t",
                 str(duration),  # Match foreground duration
+                # Encode once, explicitly, and drop the music's tags
+                "-map_metadata",
+                "-1",
+                *_MP3_ENCODE_ARGS,
                 output_path,
                 "-y",
             ],
@@ -900,17 +1213,27 @@ class AudioMixer:
 class MultiVoiceTTS:
     """Multi-voice TTS generator supporting multiple providers"""
 
+    # Pause stitched between consecutive segments in the same voice (seconds)
+    SAME_VOICE_GAP = 0.3
+
     def __init__(
         self,
         voice_mapper: VoiceMapper,
         audio_mixer: AudioMixer | None = None,
         provider: str = "macos",
         api_key: str | None = None,
+        max_workers: int = 8,
+        cache: TTSCache | None = None,
     ):
         self.voice_mapper = voice_mapper
         self.audio_mixer = audio_mixer
         self.provider = provider
         self.api_key = api_key
+        # Concurrent segment generations per chunk (ElevenLabs requests are
+        # additionally capped process-wide by _ELEVENLABS_SLOTS)
+        self.max_workers = max_workers
+        # Segment audio cache (the same line often recurs across chunks)
+        self.cache = cache
 
         # Voice ID mapping for ElevenLabs (name → voice_id)
         self.elevenlabs_voice_ids = {
@@ -947,11 +1270,7 @@ class MultiVoiceTTS:
         segments = []
         current_pos = 0
 
-        # Pattern matches voice tags with optional tone attribute
-        # <VOICE:TYPE> or <VOICE:TYPE tone="emotion">
-        pattern = r'<VOICE:(\w+)(?:\s+tone="([^"]*)")?>(.*?)</VOICE:\1>'
-
-        for match in re.finditer(pattern, text, flags=re.DOTALL):
+        for match in _VOICE_SEGMENT_RE.finditer(text):
             # Add narration before this tag
             if match.start() > current_pos:
                 narration = text[current_pos : match.start()].strip()
@@ -999,46 +1318,78 @@ class MultiVoiceTTS:
         if not segments:
             return
 
-        # Generate audio for each segment, tracking voices
-        temp_files_with_voices = []  # List of (voice, Path) tuples
-        # Use unique temp directory per chunk to avoid conflicts
+        # say renders pauses inline, so consecutive same-voice segments that
+        # would only be stitched with a plain gap become one say process
+        # (crossfaded mixes still need every segment separately)
+        if self.provider != "elevenlabs" and (conservative_pauses or not self.audio_mixer):
+            segments = self._merge_same_voice(segments)
+
+        # One TTS instance per distinct voice, shared by all its segments
+        tts_by_voice: dict[str, ElevenLabsTTS | MacOSTTS] = {}
+        for voice, _ in segments:
+            if voice in tts_by_voice:
+                continue
+            # Generate audio using appropriate provider
+            if self.provider == "elevenlabs":
+                # Convert voice name to voice_id for ElevenLabs
+                voice_id = self.elevenlabs_voice_ids.get(voice, voice)
+                tts_by_voice[voice] = ElevenLabsTTS(
+                    api_key=self.api_key, voice=voice_id, cache=self.cache
+                )
+            else:
+                # Default: macOS say
+                tts_by_voice[voice] = MacOSTTS(voice=voice, cache=self.cache)
+
+        # Use unique temp directory per chunk to avoid conflicts, off the
+        # output filesystem (segments are written once and read once)
         output_stem = Path(output_path).stem
-        temp_dir = Path(output_path).parent / f"temp_segments_{output_stem}"
-        temp_dir.mkdir(exist_ok=True)
+        temp_dir = Path(tempfile.mkdtemp(prefix=f"segments_{output_stem}_", dir=_scratch_dir()))
 
-        try:
-            for i, (voice, content) in enumerate(segments):
-                segment_file = temp_dir / f"segment_{i:04d}.mp3"
-
-                # Generate audio using appropriate provider
-                if self.provider == "elevenlabs":
-                    # Convert voice name to voice_id for ElevenLabs
-                    voice_id = self.elevenlabs_voice_ids.get(voice, voice)
-                    tts = ElevenLabsTTS(api_key=self.api_key, voice=voice_id)
-                else:
-                    # Default: macOS say
-                    tts = MacOSTTS(voice=voice)
+        # say segments stay lossless WAV until the one final encode;
+        # ElevenLabs already delivers mp3, which is decoded only once
+        segment_suffix = ".mp3" if self.provider == "elevenlabs" else ".wav"
+
+        def generate_segment(i: int, voice: str, content: str) -> Path:
+            segment_file = temp_dir / f"segment_{i:04d}{segment_suffix}"
+            tts_by_voice[voice].generate(content, str(segment_file))
+            return segment_file
 
-                tts.generate(content, str(segment_file))
-                temp_files_with_voices.append((voice, segment_file))
+        try:
+            # Segments are independent API calls or say runs: generate them
+            # concurrently, keeping their original order for stitching
+            workers = min(self.max_workers, len(segments))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                segment_files = list(
+                    pool.map(
+                        generate_segment,
+                        range(len(segments)),
+                        *zip(*segments),
+                    )
+                )
+            # List of (voice, Path) tuples
+            temp_files_with_voices = [
+                (voice, segment_file)
+                for (voice, _), segment_file in zip(segments, segment_files)
+            ]
 
             # Use conservative pauses if requested (Option A)
             if conservative_pauses:
                 self._stitch_audio_with_pauses(temp_files_with_voices, output_path)
             # Use advanced mixing if AudioMixer available (Option C)
             elif self.audio_mixer:
-                temp_output = temp_dir / "mixed_output.mp3"
                 files_only = [f for _, f in temp_files_with_voices]
-                self.audio_mixer.crossfade_segments(files_only, str(temp_output))
 
-                # Add background music if configured
+                # Add background music if configured (the crossfaded mix
+                # stays WAV so the mix with the music is the only encode)
                 if self.audio_mixer.background_music:
-                    self.audio_mixer.mix_with_background(str(temp_output), output_path)
+                    temp_output = temp_dir / "mixed_output.wav"
+                    self.audio_mixer.crossfade_segments(files_only, str(temp_output))
+                    self.audio_mixer.mix_with_background(
+                        str(temp_output), output_path, duration=_wav_duration(temp_output)
+                    )
                     temp_output.unlink()
                 else:
-                    import shutil
-
-                    shutil.move(str(temp_output), output_path)
+                    self.audio_mixer.crossfade_segments(files_only, output_path)
             else:
                 # Option B: Basic concatenation with silence
                 files_only = [f for _, f in temp_files_with_voices]
@@ -1046,80 +1397,73 @@ class MultiVoiceTTS:
 
         finally:
             # Cleanup temp directory completely
-            import shutil
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
-    def _stitch_audio(self, input_files: list[Path], output_path: str) -> None:
-        """Stitch audio segments together with silence between"""
+    @staticmethod
+    def _concat_with_gaps(
+        input_files: list[Path], gaps: list[float], output_path: str
+    ) -> None:
+        """Concatenate audio files with gaps[i] seconds of silence after file i
 
-        if len(input_files) == 1:
-            # Just rename/copy single file
-            import shutil
+        A single ffmpeg run: the silences are generated inside the filter
+        graph, so no silent mp3s or concat list ever touch the disk.
+        """
+        inputs: list[str] = []
+        filters = []
+        labels = []
+        for i, (audio_file, gap) in enumerate(zip(input_files, gaps + [0.0])):
+            inputs += ["-i", str(audio_file)]
+            # Providers differ in rate and layout; concat needs them uniform
+            filters.append(
+                f"[{i}:a]aformat=sample_rates=44100:channel_layouts=stereo[a{i}]"
+            )
+            labels.append(f"[a{i}]")
+            if gap:
+                filters.append(f"aevalsrc=0|0:c=stereo:s=44100:d={gap}[s{i}]")
+                labels.append(f"[s{i}]")
+        filters.append(f"{''.join(labels)}concat=n={len(labels)}:v=0:a=1[out]")
 
-            shutil.copy(input_files[0], output_path)
-            return
+        subprocess.run(
+            [
+                "ffmpeg",
+                *inputs,
+                "-filter_complex",
+                ";".join(filters),
+                "-map",
+                "[out]",
+                *_MP3_ENCODE_ARGS,
+                "-threads",
+                _FFMPEG_THREADS,
+                output_path,
+                "-y",
+            ],
+            check=True,
+            capture_output=True,
+        )
 
-        # Create concat file for ffmpeg
-        concat_file = Path(output_path).parent / "concat_list.txt"
+    @classmethod
+    def _merge_same_voice(cls, segments: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Join runs of same-voice segments, keeping the gap as a say pause
 
-        try:
-            with open(concat_file, "w") as f:
-                for i, audio_file in enumerate(input_files):
-                    f.write(f"file '{audio_file.absolute()}'\n")
-                    # Add 300ms silence between segments (except after last)
-                    if i < len(input_files) - 1:
-                        # Generate tiny silence file
-                        silence_file = audio_file.parent / f"silence_{i:04d}.mp3"
-                        subprocess.run(
-                            [
-                                "ffmpeg",
-                                "-f",
-                                "lavfi",
-                                "-i",
-                                "anullsrc=r=44100:cl=stereo",
-                                "-t",
-                                "0.3",
-                                "-acodec",
-                                "libmp3lame",
-                                "-b:a",
-                                "192k",
-                                str(silence_file),
-                                "-y",
-                            ],
-                            check=True,
-                            capture_output=True,
-                        )
-                        f.write(f"file '{silence_file.absolute()}'\n")
-
-            # Concatenate with ffmpeg
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(concat_file),
-                    "-c",
-                    "copy",
-                    output_path,
-                    "-y",
-                ],
-                check=True,
-                capture_output=True,
-            )
+        ``[[slnc ms]]`` is say's embedded silence command, so the merged
+        segment sounds the same as the separately stitched ones.
+        """
+        pause = f" [[slnc {int(cls.SAME_VOICE_GAP * 1000)}]] "
+        merged: list[tuple[str, str]] = []
+        for voice, content in segments:
+            if merged and merged[-1][0] == voice:
+                merged[-1] = (voice, merged[-1][1] + pause + content)
+            else:
+                merged.append((voice, content))
+        return merged
 
-        finally:
-            # Cleanup
-            if concat_file.exists():
-                concat_file.unlink()
-            # Cleanup silence files
-            for i in range(len(input_files) - 1):
-                silence_file = input_files[0].parent / f"silence_{i:04d}.mp3"
-                if silence_file.exists():
-                    silence_file.unlink()
+    def _stitch_audio(self, input_files: list[Path], output_path: str) -> None:
+        """Stitch audio segments together with silence between"""
+        # A single file still goes through the encode: segments are WAV or
+        # provider mp3 (e.g. ElevenLabs mono 128k), not the episode format.
+        # 300ms silence between segments (except after last)
+        gaps = [self.SAME_VOICE_GAP] * (len(input_files) - 1)
+        self._concat_with_gaps(input_files, gaps, output_path)
 
     def _stitch_audio_with_pauses(
         self, segments: list[tuple[str, Path]], output_path: str
@@ -1135,99 +1479,23 @@ class MultiVoiceTTS:
         - 2.5 seconds before voice changes (research-backed)
         - 0.3 seconds between same-voice segments
         """
-        if len(segments) == 1:
-            import shutil
-
-            shutil.copy(segments[0][1], output_path)
-            return
-
-        concat_file = Path(output_path).parent / "concat_list.txt"
-
-        try:
-            with open(concat_file, "w") as f:
-                for i, (voice, audio_file) in enumerate(segments):
-                    f.write(f"file '{audio_file.absolute()}'\n")
-
-                    # Add silence between segments (except after last)
-                    if i < len(segments) - 1:
-                        # Detect voice change
-                        next_voice = segments[i + 1][0]
-                        voice_changed = voice != next_voice
-
-                        # 2.5s for voice changes (research-backed standard)
-                        # 0.3s for same voice (existing behavior)
-                        silence_duration = 2.5 if voice_changed else 0.3
-
-                        # Debug output
-                        print(
-                            f"   Segment {i}: {voice} → {next_voice} | Change: {voice_changed} | Pause: {silence_duration}s"
-                        )
-
-                        # Generate silence using pydub (more reliable than ffmpeg)
-                        try:
-                            from pydub import AudioSegment
-
-                            # Create silence of the specified duration
-                            silence = AudioSegment.silent(
-                                duration=int(silence_duration * 1000)
-                            )  # pydub uses milliseconds
-                            silence_file = audio_file.parent / f"silence_{i:04d}.mp3"
-                            silence.export(
-                                str(silence_file), format="mp3", bitrate="192k"
-                            )
-                            f.write(f"file '{silence_file.absolute()}'\n")
-                        except ImportError:
-                            # Fallback to ffmpeg if pydub not available
-                            silence_file = audio_file.parent / f"silence_{i:04d}.mp3"
-                            subprocess.run(
-                                [
-                                    "ffmpeg",
-                                    "-f",
-                                    "lavfi",
-                                    "-i",
-                                    "anullsrc=r=44100:cl=stereo",
-                                    "-t",
-                                    str(silence_duration),
-                                    "-acodec",
-                                    "libmp3lame",
-                                    "-b:a",
-                                    "192k",
-                                    str(silence_file),
-                                    "-y",
-                                ],
-                                check=True,
-                                capture_output=True,
-                            )
-                            f.write(f"file '{silence_file.absolute()}'\n")
-
-            # Concatenate with ffmpeg
-            subprocess.run(
-                [
-                    "ffmpeg",
-                    "-f",
-                    "concat",
-                    "-safe",
-                    "0",
-                    "-i",
-                    str(concat_file),
-                    "-c",
-                    "copy",
-                    output_path,
-                    "-y",
-                ],
-                check=True,
-                capture_output=True,
+        # A single segment still goes through the encode (see _stitch_audio)
+        gaps = []
+        for i, ((voice, _), (next_voice, _)) in enumerate(zip(segments, segments[1:])):
+            # Detect voice change
+            voice_changed = voice != next_voice
+
+            # 2.5s for voice changes (research-backed standard)
+            # 0.3s for same voice (existing behavior)
+            silence_duration = 2.5 if voice_changed else self.SAME_VOICE_GAP
+            gaps.append(silence_duration)
+
+            # Debug output
+            print(
+                f"   Segment {i}: {voice} → {next_voice} | Change: {voice_changed} | Pause: {silence_duration}s"
             )
 
-        finally:
-            # Cleanup
-            if concat_file.exists():
-                concat_file.unlink()
-            # Cleanup silence files
-            for i in range(len(segments) - 1):
-                silence_file = segments[0][1].parent / f"silence_{i:04d}.mp3"
-                if silence_file.exists():
-                    silence_file.unlink()
+        self._concat_with_gaps([f for _, f in segments], gaps, output_path)
 
 
 class DocToAudioConverter:
@@ -1249,8 +1517,20 @@ class DocToAudioConverter:
         narrator_voice: str | None = None,
         conservative_multivoice: bool = False,
         narrative: bool = False,
+        tts_cache: bool = True,
+        jobs: int | None = None,
+        embed_transcripts: bool = True,
     ):
-        self.console = Console() if HAS_RICH else None
+        self.console = _rich_console()
+        self.provider = provider
+        self.embed_transcripts = embed_transcripts
+        if jobs is None:
+            if provider == "macos":
+                jobs = min(os.cpu_count() or 1, _DEFAULT_JOBS)
+            else:
+                jobs = _DEFAULT_JOBS
+        self.jobs = max(1, jobs)
+        self.cache = TTSCache() if tts_cache else None
         self.cleaner = MarkdownCleaner(multi_voice=multi_voice, narrative=narrative)
 
         # Set chunk size based on provider limits
@@ -1305,21 +1585,37 @@ class DocToAudioConverter:
                 audio_mixer=audio_mixer,
                 provider=provider,
                 api_key=mv_api_key,
+                # Split the segment threads across concurrent chunks
+                max_workers=max(1, _ELEVENLABS_MAX_CONCURRENT // self.jobs),
+                cache=self.cache,
             )
         elif provider == "macos":
             # macOS doesn't need an API key
-            self.tts = MacOSTTS(voice=voice or "Daniel")
+            self.tts = MacOSTTS(voice=voice or "Daniel", cache=self.cache)
         else:
             if api_key is None:
                 api_key = self._get_api_key(provider)
 
             if provider == "elevenlabs":
-                self.tts = ElevenLabsTTS(api_key=api_key, voice=voice or "Adam")
+                self.tts = ElevenLabsTTS(
+                    api_key=api_key, voice=voice or "Adam", cache=self.cache
+                )
             elif provider == "openai":
-                self.tts = OpenAITTS(api_key=api_key, voice=voice or "alloy")
+                self.tts = OpenAITTS(
+                    api_key=api_key, voice=voice or "alloy", cache=self.cache
+                )
             else:
                 raise ValueError(f"Unsupported provider: {provider}")
 
+    @property
+    def encodes_every_part(self) -> bool:
+        """Whether every part is this script's own encode (_MP3_ENCODE_ARGS)
+
+        Single-voice API chunks are the provider's native mp3 instead (e.g.
+        ElevenLabs mono 128k, OpenAI 24 kHz).
+        """
+        return self.multi_voice or self.provider == "macos"
+
     def _get_api_key(self, provider: str) -> str:
         """Get API key from environment or keychain"""
 
@@ -1363,9 +1659,13 @@ class DocToAudioConverter:
         return api_key
 
     def convert_file(
-        self, input_path: str, output_name: str | None = None
+        self, input_path: str, output_name: str | None = None, require_all: bool = False
     ) -> list[Path]:
-        """Convert single markdown file to audio"""
+        """Convert single markdown file to audio
+
+        Chunks that fail are reported and skipped, unless ``require_all`` is
+        set, in which case any failed chunk raises RuntimeError.
+        """
 
         input_path_obj = Path(input_path)
         if not input_path_obj.exists():
@@ -1382,9 +1682,14 @@ class DocToAudioConverter:
 
         # Clean for TTS (with or without voice tags)
         if self.multi_voice:
-            cleaned = self.cleaner.clean_with_tags(markdown)
+            clean = self.cleaner.clean_with_tags
+        else:
+            clean = self.cleaner.clean
+        if self.cache is not None:
+            options = f"multi_voice={self.multi_voice},narrative={self.cleaner.narrative}"
+            cleaned = self.cache.cleaned_for(markdown, options, clean)
         else:
-            cleaned = self.cleaner.clean(markdown)
+            cleaned = clean(markdown)
 
         # Chunk if needed
         chunks = self.chunker.chunk(cleaned)
@@ -1400,13 +1705,12 @@ class DocToAudioConverter:
                 self.print_info("   Mode: Multi-voice (Option B)")
                 self.print_info(f"   Narrator: {narrator}")
 
-        # Generate audio for each chunk
-        audio_files: list[Path] = []
-        for i, chunk in enumerate(chunks):
-            chunk_name = f"{output_name}_part{i + 1:03d}.mp3"
-            chunk_path = self.output_dir / chunk_name
+        # Chunks are independent renders (API calls or say + ffmpeg runs):
+        # generate up to self.jobs of them at once, keeping their order
+        def generate_chunk(i: int, chunk: str) -> Path | None:
+            chunk_path = self.output_dir / f"{output_name}_part{i + 1:03d}.mp3"
 
-            self.print_info(f"   Generating: {chunk_name}")
+            self.print_info(f"   Generating: {chunk_path.name}")
 
             try:
                 if self.multi_voice:
@@ -1419,14 +1723,27 @@ class DocToAudioConverter:
                 else:
                     # Use single-voice generation
                     self.tts.generate(chunk, str(chunk_path))
-                audio_files.append(chunk_path)
-
-                # Embed transcript for accessibility (read-along support)
-                if self._embed_transcript(chunk_path, chunk, output_name):
-                    self.print_info(f"   📝 Embedded transcript ({len(chunk)} chars)")
             except Exception as e:
                 self.print_error(f"   Error: {e}")
+                return None
+            return chunk_path
+
+        workers = min(self.jobs, len(chunks)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(generate_chunk, range(len(chunks)), chunks))
+        audio_files = [path for path in results if path is not None]
+
+        if require_all and len(audio_files) < len(chunks):
+            failed = len(chunks) - len(audio_files)
+            raise RuntimeError(f"{failed} of {len(chunks)} chunks failed to generate")
+
+        # Embed transcripts for accessibility (read-along support) once all
+        # audio is written, keeping tag I/O out of the generation workers
+        for chunk_path, chunk in zip(results, chunks):
+            if not self.embed_transcripts or chunk_path is None:
                 continue
+            if self._embed_transcript(chunk_path, chunk, output_name):
+                self.print_info(f"   📝 Embedded transcript ({len(chunk)} chars)")
 
         # Generate metadata
         metadata_path = self.output_dir / f"{output_name}_metadata.json"
@@ -1436,8 +1753,19 @@ class DocToAudioConverter:
 
         return audio_files
 
-    def convert_directory(self, input_dir: str, recursive: bool = False) -> None:
-        """Convert all markdown files in directory"""
+    def convert_directory(
+        self, input_dir: str, recursive: bool = False, workers: int | None = None
+    ) -> None:
+        """Convert all markdown files in directory
+
+        Files are converted concurrently on up to ``workers`` threads: each
+        one spends most of its time waiting on a TTS API or on say/ffmpeg
+        processes, so cleaning and generation of different files overlap.
+        By default that is the converter's jobs; for ElevenLabs, whose
+        account concurrency is limited, the file pool only fills what
+        chunk-level concurrency leaves of the default job budget (one file
+        at a time at --jobs 4) so files x chunks don't multiply past it.
+        """
 
         input_dir_obj = Path(input_dir)
         if not input_dir_obj.is_dir():
@@ -1448,7 +1776,7 @@ class DocToAudioConverter:
 
         self.print_info(f"\n📁 Found {len(md_files)} markdown files")
 
-        for md_file in md_files:
+        def convert(md_file: Path) -> None:
             try:
                 # Generate output name from relative path
                 rel_path = md_file.relative_to(input_dir_obj)
@@ -1457,7 +1785,20 @@ class DocToAudioConverter:
                 self.convert_file(str(md_file), output_name)
             except Exception as e:
                 self.print_error(f"Error processing {md_file}: {e}")
-                continue
+
+        if not md_files:
+            return
+
+        if workers is None:
+            if self.provider == "elevenlabs":
+                workers = max(1, _DEFAULT_JOBS // self.jobs)
+            else:
+                workers = self.jobs
+
+        with ThreadPoolExecutor(max_workers=min(workers, len(md_files))) as pool:
+            # Drain the iterator so every file is processed before returning
+            for _ in pool.map(convert, md_files):
+                pass
 
     def _write_metadata(
         self, metadata_path: Path, input_path: Path, audio_files: list[Path]
@@ -1485,27 +1826,36 @@ class DocToAudioConverter:
         if not HAS_MUTAGEN:
             return False
 
-        try:
-            audio = MP3(str(audio_path))
+        from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, USLT
 
-            # Ensure ID3 tags exist
-            if audio.tags is None:
-                audio.add_tags()
+        try:
+            # Only the ID3 tag is read and rewritten; the MPEG frames are
+            # never parsed
+            try:
+                tags = ID3(str(audio_path))
+            except ID3NoHeaderError:
+                tags = ID3()
 
             # Add transcript as unsynchronized lyrics
-            audio.tags.add(
-                USLT(encoding=3, lang="eng", desc="Transcript", text=transcript)
-            )
+            tags.add(USLT(encoding=3, lang="eng", desc="Transcript", text=transcript))
 
             # Add title if provided
             if title:
-                audio.tags.add(TIT2(encoding=3, text=title))
+                tags.add(TIT2(encoding=3, text=title))
 
-            audio.save()
+            tags.save(str(audio_path))
             return True
         except Exception:
             return False
 
+    def finish_cache(self) -> None:
+        """Print the TTS cache hit rate for this run and trim the cache"""
+        if self.cache is None:
+            return
+        if self.cache.hits + self.cache.misses:
+            self.print_info(f"\n♻️  {self.cache.summary()}")
+        self.cache.curate()
+
     def print_info(self, text: str) -> None:
         """Print info message"""
         if HAS_RICH:
@@ -1540,7 +1890,9 @@ def main() -> None:
     )
 
     parser.add_argument(
-        "--output", default="audio", help="Output directory for audio files"
+        "--output",
+        default="audio",
+        help="Output directory for audio files, or '-' to write a single file's mp3 to stdout",
     )
 
     parser.add_argument(
@@ -1615,23 +1967,43 @@ def main() -> None:
         help="Narrative/drama mode: strips headers and metadata (Characters:, Setting:, etc.) for cleaner audio drama output.",
     )
 
+    parser.add_argument(
+        "--tts-cache",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Reuse cleaned text and generated audio for unchanged input from ~/.cache/simulacrum-stories (default: on)",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Chunks (and files) to generate concurrently (default: 4; macOS: up to 4, one per core)",
+    )
+
     args = parser.parse_args()
 
+    converter_options = dict(
+        provider=args.provider,
+        api_key=args.api_key,
+        voice=args.voice,
+        multi_voice=args.multi_voice,
+        advanced_mixing=args.advanced_mixing,
+        crossfade_duration=args.crossfade,
+        normalize=not args.no_normalize,
+        background_music=args.background_music,
+        narrator_voice=args.narrator,
+        conservative_multivoice=args.conservative_multivoice,
+        narrative=args.narrative,
+        tts_cache=args.tts_cache,
+        jobs=args.jobs,
+    )
+
+    if args.output == "-":
+        stream_to_stdout(args.input, converter_options)
+        return
+
     try:
-        converter = DocToAudioConverter(
-            provider=args.provider,
-            api_key=args.api_key,
-            voice=args.voice,
-            output_dir=args.output,
-            multi_voice=args.multi_voice,
-            advanced_mixing=args.advanced_mixing,
-            crossfade_duration=args.crossfade,
-            normalize=not args.no_normalize,
-            background_music=args.background_music,
-            narrator_voice=args.narrator,
-            conservative_multivoice=args.conservative_multivoice,
-            narrative=args.narrative,
-        )
+        converter = DocToAudioConverter(output_dir=args.output, **converter_options)
 
         input_path = Path(args.input)
 
@@ -1643,10 +2015,94 @@ def main() -> None:
             print(f"Error: {input_path} is neither a file nor directory")
             sys.exit(1)
 
+        converter.finish_cache()
+
     except Exception as e:
         print(f"\nError: {e}")
         sys.exit(1)
 
 
+def stream_to_stdout(input_file: str, converter_options: dict[str, Any]) -> None:
+    """Convert one file and write its mp3 to stdout (``--output -``)
+
+    Parts are staged in a scratch directory and remuxed onto stdout so a
+    downstream ffmpeg can read them from a pipe. All status output is
+    redirected to stderr to keep the audio stream clean.
+    """
+    if not Path(input_file).is_file():
+        print("Error: --output - requires a single input file", file=sys.stderr)
+        sys.exit(1)
+
+    audio_out = sys.stdout.buffer
+    with (
+        tempfile.TemporaryDirectory(prefix="doc-to-audio-") as scratch,
+        contextlib.redirect_stdout(sys.stderr),
+    ):
+        try:
+            # Tags would be dropped by the remux below anyway
+            converter = DocToAudioConverter(
+                output_dir=scratch, embed_transcripts=False, **converter_options
+            )
+            # A partial episode is worse than none: fail on any missing chunk
+            audio_files = converter.convert_file(input_file, require_all=True)
+            converter.finish_cache()
+        except Exception as e:
+            print(f"\nError: {e}")
+            sys.exit(1)
+
+        if not audio_files:
+            sys.exit(1)
+
+        # Remux through ffmpeg's concat demuxer rather than joining the
+        # files' bytes: each part starts with its own ID3 tag and Xing/Info
+        # frame, which would otherwise land mid-stream as junk frames. No
+        # header is written either, as a pipe can't be seeked to fill it in.
+        # Parts are stream-copied only when all of them share the episode
+        # format; provider-native parts are re-encoded to it
+        if converter.encodes_every_part:
+            codec_args = ["-c", "copy"]
+        else:
+            codec_args = _MP3_ENCODE_ARGS
+        concat_list = Path(scratch) / "parts.txt"
+        concat_list.write_text(
+            "".join(
+                "file '{}'\n".format(str(p.absolute()).replace("'", "'\\''"))
+                for p in audio_files
+            )
+        )
+        try:
+            subprocess.run(
+                [
+                    "ffmpeg",
+                    "-v",
+                    "error",
+                    "-f",
+                    "concat",
+                    "-safe",
+                    "0",
+                    "-i",
+                    str(concat_list),
+                    *codec_args,
+                    "-map_metadata",
+                    "-1",
+                    "-id3v2_version",
+                    "0",
+                    "-write_xing",
+                    "0",
+                    "-f",
+                    "mp3",
+                    "-",
+                ],
+                stdout=audio_out,
+                stderr=subprocess.PIPE,
+                check=True,
+            )
+        except subprocess.CalledProcessError as e:
+            print(f"\nError: ffmpeg failed: {e.stderr.decode(errors='replace')}")
+            sys.exit(1)
+
+    audio_out.flush()
+
+
 if __name__ == "__main__":
     main()
@@ -22,8 +22,13 @@ Usage:
     ./audio-budget-manager.py reset-month
 """
 
+import contextlib
+import fcntl
 import json
+import os
 import sys
+import tempfile
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
 from datetime import date, datetime
 from pathlib import Path
@@ -121,18 +126,35 @@ class AudioBudgetManager:
 
         # Load usage state (separate file, not in git)
         if self.usage_path.exists():
-            with open(self.usage_path) as f:
-                usage_data = json.load(f)
-            self.usage = {
-                k: UsageTracker(**v) for k, v in usage_data.get("usage", {}).items()
-            }
-            self.queue = [QueuedJob(**j) for j in usage_data.get("queue", [])]
+            self.load_usage()
         else:
             # Create empty usage state
             self.usage = {}
             self.queue = []
             self.save_usage()
 
+    def load_usage(self):
+        """(Re)load usage state from disk"""
+        with open(self.usage_path) as f:
+            usage_data = json.load(f)
+        self.usage = {k: UsageTracker(**v) for k, v in usage_data.get("usage", {}).items()}
+        self.queue = [QueuedJob(**j) for j in usage_data.get("queue", [])]
+
+    @contextlib.contextmanager
+    def usage_lock(self) -> Iterator[None]:
+        """Exclusive inter-process lock over the usage file
+
+        Held on a sidecar file so the usage file itself can be replaced
+        atomically while locked.
+        """
+        lock_path = self.usage_path.with_suffix(".lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
     def save_config(self):
         """Save configuration (budgets and provider settings)"""
         config_data = {
@@ -149,8 +171,15 @@ class AudioBudgetManager:
             "queue": [asdict(j) for j in self.queue],
             "last_updated": datetime.now().isoformat(),
         }
-        with open(self.usage_path, "w") as f:
-            json.dump(usage_data, f, indent=2)
+        # Write then rename, so readers never see a half-written file
+        fd, tmp = tempfile.mkstemp(dir=self.usage_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(usage_data, f, indent=2)
+            os.replace(tmp, self.usage_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
 
     def get_usage(self, provider: str) -> UsageTracker:
         """Get or create usage tracker for provider"""
@@ -222,6 +251,21 @@ class AudioBudgetManager:
 
         self.save_usage()
 
+    def request(self, provider: str, chars: int, doc: str = "") -> tuple[bool, str]:
+        """Check limits and record the usage if it is approved
+
+        The check and the update run against the usage on disk under
+        usage_lock(), so concurrent processes never work from a stale
+        snapshot or overwrite each other's usage.
+        """
+        with self.usage_lock():
+            if self.usage_path.exists():
+                self.load_usage()
+            can_use, reason = self.can_use(provider, chars)
+            if can_use:
+                self.record_usage(provider, chars, doc)
+        return can_use, reason
+
     def add_to_queue(
         self, doc_path: str, provider: str, priority: str, estimated_chars: int
     ):
@@ -375,9 +419,8 @@ def main():
         provider = sys.argv[2]
         chars = int(sys.argv[3])
 
-        can_use, reason = manager.can_use(provider, chars)
+        can_use, reason = manager.request(provider, chars)
         if can_use:
-            manager.record_usage(provider, chars)
             print(f"✅ Approved: {chars:,} chars for {provider}")
             print(f"   {reason}")
         else:
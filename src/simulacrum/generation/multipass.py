@@ -242,6 +242,10 @@ class MultiPassSceneGenerator:
             - pass_results: list of GenerationPass objects
         """
 
+        # The passes run strictly in sequence: each prompt is built from the
+        # previous pass's output (plot -> emotional -> dialogue -> polish),
+        # so there are no independent LLM calls to issue concurrently here.
+        # Concurrency lives one level up, across series (daily-production --all).
         pass_results = []
 
         # Log model configuration